@@ -31,6 +31,12 @@ def set_language(language: str) -> None:
     _translations = json.loads(file_path.read_text(encoding="utf-8"))
 
 
+def get_language() -> str:
+    """Возвращает код текущего языка интерфейса."""
+
+    return _current_locale
+
+
 def translate(key: str) -> str:
     """Возвращает перевод ключа."""
 
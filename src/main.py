@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -63,6 +64,8 @@ def initialize_workdir(base_dir: Path) -> bool:
 def main() -> int:
     """Основная точка входа: готовит окружение и запускает приложение."""
 
+    # В собранном приложении дочерние процессы разбора логов не должны запускать GUI.
+    multiprocessing.freeze_support()
     home_dir = Path(os.environ.get("DSM_HOME", Path.home()))
     base_dir = home_dir / ".dsmanager"
     configure_logging(base_dir / "logs")
@@ -5,8 +5,10 @@ from __future__ import annotations
 import logging
 import os
 import shlex
+import signal
 import subprocess
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
@@ -17,6 +19,17 @@ from src.projects.models import Project
 
 _LOG_QUEUE: "Queue[tuple[Path, str]]" = Queue()
 _LOG_WRITER_STARTED = False
+# Как часто блокирующий запуск проверяет запрос отмены, в секундах
+_CANCEL_POLL_INTERVAL = 0.05
+# Сколько ждать завершения после SIGTERM при отмене, прежде чем отправить SIGKILL
+_CANCEL_GRACE_PERIOD = 3.0
+
+
+_KILL_SIGNAL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+
+class ProjectRunCancelled(RuntimeError):
+    """Запуск проекта отменён до завершения команды."""
 
 
 def _ensure_log_writer() -> None:
@@ -59,8 +72,13 @@ def execute_project(
     project: Project,
     connection: Connection,
     log_file: Optional[Path],
+    cancel: Optional[threading.Event] = None,
 ) -> ProjectExecutionResult:
-    """Запускает проект локально и собирает результат выполнения."""
+    """Запускает проект локально и собирает результат выполнения.
+
+    Установленный ``cancel`` прерывает блокирующую команду: процесс завершается,
+    а функция выбрасывает ProjectRunCancelled.
+    """
 
     if connection.type != "local":
         raise RuntimeError("Запуск проектов через удалённые соединения будет реализован позднее.")
@@ -81,7 +99,7 @@ def execute_project(
             log_file=log_file if project.save_logs else None,
         )
 
-    output, return_code = _run_blocking(command, working_dir, project.timeout_seconds, env)
+    output, return_code = _run_blocking(command, working_dir, project.timeout_seconds, env, cancel)
     if project.save_logs and log_file:
         _write_limited_log(project, log_file, output, project.max_log_lines)
     status = "success" if return_code == 0 else "failed"
@@ -156,22 +174,66 @@ def _run_blocking(
     working_dir: Optional[Path],
     timeout_seconds: int,
     env: Dict[str, str],
+    cancel: Optional[threading.Event] = None,
 ) -> Tuple[str, int]:
     """Выполняет команду синхронно и возвращает вывод и код возврата."""
 
     timeout = None if timeout_seconds <= 0 else timeout_seconds
-    completed = subprocess.run(  # noqa: PLW1510 - нужно shell для сложных команд
+    if cancel is None:
+        completed = subprocess.run(  # noqa: PLW1510 - нужно shell для сложных команд
+            command,
+            cwd=str(working_dir) if working_dir else None,
+            shell=True,
+            check=False,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=timeout,
+            env=env,
+        )
+        return completed.stdout or "", completed.returncode
+
+    process = subprocess.Popen(  # noqa: P204
         command,
         cwd=str(working_dir) if working_dir else None,
         shell=True,
-        check=False,
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        timeout=timeout,
         env=env,
+        start_new_session=True,
     )
-    return completed.stdout or "", completed.returncode
+    deadline = None if timeout is None else time.monotonic() + timeout
+    # communicate() с таймаутом можно повторять без потери вывода, между попытками
+    # проверяем отмену и общий таймаут команды.
+    while True:
+        try:
+            output, _ = process.communicate(timeout=_CANCEL_POLL_INTERVAL)
+            return output or "", process.returncode
+        except subprocess.TimeoutExpired:
+            if cancel.is_set():
+                _signal_process_group(process, signal.SIGTERM)
+                try:
+                    process.communicate(timeout=_CANCEL_GRACE_PERIOD)
+                except subprocess.TimeoutExpired:
+                    # Команда перехватила или игнорирует SIGTERM: не блокируем поток пула
+                    _signal_process_group(process, _KILL_SIGNAL)
+                    process.communicate()
+                raise ProjectRunCancelled(command) from None
+            if deadline is not None and time.monotonic() >= deadline:
+                _signal_process_group(process, _KILL_SIGNAL)
+                process.communicate()
+                raise subprocess.TimeoutExpired(command, timeout) from None
+
+
+def _signal_process_group(process: subprocess.Popen[str], signum: int) -> None:
+    """Отправляет сигнал всей группе процесса: shell и запущенным им командам."""
+
+    try:
+        os.killpg(process.pid, signum)
+    except (AttributeError, OSError):
+        # Нет групп процессов (Windows) или группа уже завершилась
+        process.send_signal(signum)
 
 
 def _run_detached(
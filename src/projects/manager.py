@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from src.connections.models import Connection
-from src.projects.executor import enqueue_project_log, execute_project
+from src.projects.executor import ProjectRunCancelled, enqueue_project_log, execute_project
 from src.projects.models import Project, ProjectRunHistory
 
 
@@ -85,8 +86,16 @@ class ProjectManager:
                 file.unlink()
             self._remove_logs(identifier)
 
-    def run_project(self, identifier: str, connection: Connection) -> ProjectRunHistory:
-        """Запускает проект и добавляет запись истории."""
+    def run_project(
+        self,
+        identifier: str,
+        connection: Connection,
+        cancel: Optional[threading.Event] = None,
+    ) -> ProjectRunHistory:
+        """Запускает проект и добавляет запись истории.
+
+        ``cancel`` позволяет прервать блокирующий запуск (см. execute_project).
+        """
 
         project = self.get_project(identifier)
         start = time.time()
@@ -103,7 +112,13 @@ class ProjectManager:
             project.detached_mode,
         )
         try:
-            result = execute_project(project, connection, log_file)
+            result = execute_project(project, connection, log_file, cancel)
+        except ProjectRunCancelled:
+            # Отмена по запросу пользователя (закрытие диалога) ошибкой не считается
+            if log_file:
+                self._append_project_log(project, "запуск отменён")
+            self._logger.info("Project %s run cancelled", identifier)
+            raise
         except Exception as exc:
             if log_file:
                 self._append_project_log(project, f"ошибка запуска: {exc}")
@@ -34,11 +34,17 @@ class AboutDialog(QtWidgets.QDialog):
         if self._icon and not self._icon.isNull():
             pixmap = self._icon.pixmap(128, 128)
         elif icon_path.exists():
+            # На экранах с DPR=1 разница со сглаживанием незаметна, а масштабирование дешевле.
+            mode = (
+                QtCore.Qt.TransformationMode.SmoothTransformation
+                if self.devicePixelRatioF() > 1.0
+                else QtCore.Qt.TransformationMode.FastTransformation
+            )
             pixmap = QtGui.QPixmap(str(icon_path)).scaled(
                 128,
                 128,
                 QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
+                mode,
             )
         if pixmap:
             icon_label = QtWidgets.QLabel()
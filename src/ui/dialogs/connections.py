@@ -6,25 +6,74 @@ import logging
 import os
 import platform
 import stat
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from src.connections.docker_client import get_docker_version
 from src.connections.manager import ConnectionManager
 from src.connections.models import Connection, ConnectionStatus, SSHConfig
-from src.i18n.translator import translate
+from src.i18n.translator import get_language, translate
 from src.utils.helpers import normalize_socket_path
 
 DEFAULT_LOCAL_SOCKET = "unix:///var/run/docker.sock"
 DEFAULT_REMOTE_SOCKET = "/var/run/docker.sock"
 
+# Иконки действий берутся из темы; текстовые символы остаются запасным вариантом.
+_ACTION_ICON_THEMES = {
+    "deactivate": "media-playback-stop",
+    "activate": "media-playback-start",
+    "edit": "document-edit",
+    "test": "emblem-ok",
+    "delete": "edit-delete",
+}
+_ACTION_GLYPHS = {
+    "deactivate": "■",
+    "activate": "▶",
+    "edit": "✎",
+    "test": "✓",
+    "delete": "🗑",
+}
+_ACTION_ICONS: Dict[str, QtGui.QIcon] = {}
+
+
+def _action_icon(name: str) -> QtGui.QIcon:
+    """Возвращает закэшированную иконку действия (пустую, если тема её не содержит)."""
+
+    icon = _ACTION_ICONS.get(name)
+    if icon is None:
+        icon = QtGui.QIcon.fromTheme(_ACTION_ICON_THEMES[name])
+        _ACTION_ICONS[name] = icon
+    return icon
+
 
 class ConnectionFormDialog(QtWidgets.QDialog):
     """Форма создания/редактирования соединения с поддержкой прокрутки."""
 
+    _LABEL_KEYS = {
+        "id": "connections.fields.id",
+        "name": "connections.fields.name",
+        "comment": "connections.fields.comment",
+        "type": "connections.fields.type",
+        "socket": "connections.fields.socket",
+        "ssh_host": "connections.fields.ssh_host",
+        "ssh_port": "connections.fields.ssh_port",
+        "ssh_user": "connections.fields.ssh_user",
+        "ssh_password": "connections.fields.ssh_password",
+        "ssh_key": "connections.fields.ssh_key",
+        "remote_socket": "connections.fields.remote_socket",
+    }
+    # Подписи формы переводятся один раз на язык и разделяются всеми экземплярами.
+    _labels: Dict[str, str] = {}
+    _labels_language: Optional[str] = None
+
+    @classmethod
+    def _rebuild_labels(cls) -> None:
+        cls._labels = {field: translate(key) for field, key in cls._LABEL_KEYS.items()}
+        cls._labels_language = get_language()
+
     def __init__(
         self,
         *,
@@ -34,7 +83,13 @@ class ConnectionFormDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self._connection = connection
         self._result: Optional[Connection] = None
-        self._test_thread: Optional[ConnectionProbeThread] = None
+        self._probe_signals = ConnectionProbeSignals()
+        self._probe_signals.success.connect(self._on_test_success)
+        self._probe_signals.error.connect(self._on_test_error)
+        self._probe_signals.finished.connect(self._on_test_finished)
+        self._ssh_group: Optional[QtWidgets.QGroupBox] = None
+        if self._labels_language != get_language():
+            self._rebuild_labels()
         self.setWindowTitle(translate("connections.form.title"))
         self.resize(640, 720)
         self._build_ui()
@@ -48,7 +103,11 @@ class ConnectionFormDialog(QtWidgets.QDialog):
         content = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(content)
         content_layout.addWidget(self._build_general_group())
-        content_layout.addWidget(self._build_ssh_group())
+        # SSH-группа строится лениво при первом выборе типа remote.
+        self._ssh_container = QtWidgets.QWidget()
+        self._ssh_container_layout = QtWidgets.QVBoxLayout(self._ssh_container)
+        self._ssh_container_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.addWidget(self._ssh_container)
         content_layout.addStretch()
         scroll.setWidget(content)
         layout.addWidget(scroll)
@@ -66,6 +125,7 @@ class ConnectionFormDialog(QtWidgets.QDialog):
 
     def _build_general_group(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox(translate("connections.form.section.general"))
+        group.setUpdatesEnabled(False)
         form = QtWidgets.QFormLayout(group)
         self._id_edit = QtWidgets.QLineEdit()
         self._name_edit = QtWidgets.QLineEdit()
@@ -88,16 +148,18 @@ class ConnectionFormDialog(QtWidgets.QDialog):
         self._test_button = QtWidgets.QPushButton(translate("connections.form.test"))
         self._test_button.clicked.connect(self._test_connection)
 
-        form.addRow(translate("connections.fields.id"), self._id_edit)
-        form.addRow(translate("connections.fields.name"), self._name_edit)
-        form.addRow(translate("connections.fields.comment"), self._comment_edit)
-        form.addRow(translate("connections.fields.type"), self._type_combo)
-        form.addRow(translate("connections.fields.socket"), socket_row)
+        form.addRow(self._labels["id"], self._id_edit)
+        form.addRow(self._labels["name"], self._name_edit)
+        form.addRow(self._labels["comment"], self._comment_edit)
+        form.addRow(self._labels["type"], self._type_combo)
+        form.addRow(self._labels["socket"], socket_row)
         form.addRow("", self._test_button)
+        group.setUpdatesEnabled(True)
         return group
 
     def _build_ssh_group(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox(translate("connections.form.section.ssh"))
+        group.setUpdatesEnabled(False)
         form = QtWidgets.QFormLayout(group)
         self._ssh_host = QtWidgets.QLineEdit()
         self._ssh_port = QtWidgets.QSpinBox()
@@ -121,18 +183,30 @@ class ConnectionFormDialog(QtWidgets.QDialog):
 
         self._remote_socket_edit = QtWidgets.QLineEdit(DEFAULT_REMOTE_SOCKET)
 
-        form.addRow(translate("connections.fields.ssh_host"), self._ssh_host)
-        form.addRow(translate("connections.fields.ssh_port"), self._ssh_port)
-        form.addRow(translate("connections.fields.ssh_user"), self._ssh_user)
-        form.addRow(translate("connections.fields.ssh_password"), self._ssh_password)
+        form.addRow(self._labels["ssh_host"], self._ssh_host)
+        form.addRow(self._labels["ssh_port"], self._ssh_port)
+        form.addRow(self._labels["ssh_user"], self._ssh_user)
+        form.addRow(self._labels["ssh_password"], self._ssh_password)
         form.addRow(self._use_ssh_key)
-        form.addRow(translate("connections.fields.ssh_key"), ssh_key_row)
-        form.addRow(translate("connections.fields.remote_socket"), self._remote_socket_edit)
-        self._update_ssh_visibility(self._type_combo.currentText())
+        form.addRow(self._labels["ssh_key"], ssh_key_row)
+        form.addRow(self._labels["remote_socket"], self._remote_socket_edit)
+        self._update_ssh_key_state(self._use_ssh_key.isChecked())
+        group.setUpdatesEnabled(True)
         return group
 
+    def _ensure_ssh_group(self) -> None:
+        if self._ssh_group is not None:
+            return
+        self._ssh_group = self._build_ssh_group()
+        self._ssh_container_layout.addWidget(self._ssh_group)
+
     def _update_ssh_visibility(self, connection_type: str) -> None:
         is_remote = connection_type == "remote"
+        self._socket_picker.setEnabled(connection_type == "local")
+        if is_remote:
+            self._ensure_ssh_group()
+        elif self._ssh_group is None:
+            return
         for widget in (
             self._ssh_host,
             self._ssh_port,
@@ -143,7 +217,6 @@ class ConnectionFormDialog(QtWidgets.QDialog):
             self._remote_socket_edit,
         ):
             widget.setEnabled(is_remote)
-        self._socket_picker.setEnabled(connection_type == "local")
         self._update_ssh_key_state(self._use_ssh_key.isChecked() and is_remote)
 
     def _update_ssh_key_state(self, checked: bool) -> None:
@@ -157,12 +230,13 @@ class ConnectionFormDialog(QtWidgets.QDialog):
         index = self._type_combo.findText(connection.type)
         if index >= 0:
             self._type_combo.setCurrentIndex(index)
+        if connection.type == "remote" or connection.ssh:
+            self._ensure_ssh_group()
         if connection.type == "remote":
             self._socket_edit.setText(DEFAULT_LOCAL_SOCKET)
             self._remote_socket_edit.setText(connection.socket or DEFAULT_REMOTE_SOCKET)
         else:
             self._socket_edit.setText(normalize_socket_path(connection.socket))
-            self._remote_socket_edit.setText(DEFAULT_REMOTE_SOCKET)
         if connection.ssh:
             self._ssh_host.setText(connection.ssh.host)
             self._ssh_port.setValue(connection.ssh.port)
@@ -172,6 +246,7 @@ class ConnectionFormDialog(QtWidgets.QDialog):
             if connection.ssh.key_path:
                 self._use_ssh_key.setChecked(True)
                 self._ssh_key.setText(connection.ssh.key_path)
+            self._update_ssh_visibility(connection.type)
 
     def _show_socket_picker(self) -> None:
         sockets = discover_docker_sockets()
@@ -253,14 +328,8 @@ class ConnectionFormDialog(QtWidgets.QDialog):
             return
         self._test_button.setEnabled(False)
         self._test_status_label.setText(translate("connections.form.test"))
-        thread = ConnectionProbeThread(connection)
-        thread.success.connect(self._on_test_success)
-        thread.error.connect(self._on_test_error)
-        thread.finished.connect(lambda: self._test_button.setEnabled(True))
-        thread.finished.connect(lambda: setattr(self, "_test_thread", None))
-        thread.finished.connect(thread.deleteLater)
-        self._test_thread = thread
-        thread.start()
+        task = ConnectionProbeTask(connection, self._probe_signals)
+        QtCore.QThreadPool.globalInstance().start(task)
 
     def _on_test_success(self, message: str) -> None:
         self._test_status_label.setText(translate("connections.form.test_ok") + f" ({message})")
@@ -268,6 +337,9 @@ class ConnectionFormDialog(QtWidgets.QDialog):
     def _on_test_error(self, message: str) -> None:
         self._test_status_label.setText(translate("connections.form.test_error") + f": {message}")
 
+    def _on_test_finished(self) -> None:
+        self._test_button.setEnabled(True)
+
     def accept(self) -> None:
         model = self._build_connection_model()
         if model is None:
@@ -282,13 +354,6 @@ class ConnectionFormDialog(QtWidgets.QDialog):
     def get_connection(self) -> Optional[Connection]:
         return self._result
 
-    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
-        if self._test_thread is not None:
-            self._test_thread.requestInterruption()
-            self._test_thread.wait(200)
-            self._test_thread = None
-        super().closeEvent(event)
-
 
 class ConnectionsDialog(QtWidgets.QDialog):
     """Менеджер соединений с управлением активацией и тестированием."""
@@ -300,24 +365,32 @@ class ConnectionsDialog(QtWidgets.QDialog):
         self._state_store = QtCore.QSettings("docker-simple-manager", "ConnectionsDialog")
         self._table = QtWidgets.QTableWidget(0, 5)
         self._connections: List[Connection] = []
+        self._conn_by_id: Dict[str, Connection] = {}
         self._test_thread: Optional[ConnectionTestThread] = None
         self._has_changes = False
+        self._saved_geometry = QtCore.QByteArray()
+        self._saved_header_state = QtCore.QByteArray()
         self.setWindowTitle(translate("connections.dialog.title"))
         self.resize(950, 520)
         self._build_ui()
         self._restore_state()
         self._reload_connections()
-        self._run_status_check(initial=True)
+        # Первичная проверка стартует после отрисовки окна, чтобы не задерживать показ.
+        if self._connections:
+            self._status_label.setText(translate("connections.messages.checking"))
+        QtCore.QTimer.singleShot(0, self, lambda: self._run_status_check(initial=True))
 
     @property
     def has_changes(self) -> bool:
         return self._has_changes
 
     def _build_ui(self) -> None:
+        self.setUpdatesEnabled(False)
         layout = QtWidgets.QVBoxLayout(self)
         layout.addLayout(self._build_toolbar())
         layout.addWidget(self._build_table())
         layout.addLayout(self._build_status_row())
+        self.setUpdatesEnabled(True)
 
     def _build_toolbar(self) -> QtWidgets.QHBoxLayout:
         layout = QtWidgets.QHBoxLayout()
@@ -354,6 +427,7 @@ class ConnectionsDialog(QtWidgets.QDialog):
 
     def _reload_connections(self) -> None:
         self._connections = self._manager.list_connections()
+        self._conn_by_id = {conn.identifier: conn for conn in self._connections}
         self._refresh_table()
 
     def _refresh_table(self) -> None:
@@ -362,15 +436,21 @@ class ConnectionsDialog(QtWidgets.QDialog):
             if self._only_active_check.isChecked()
             else list(self._connections)
         )
-        self._table.setRowCount(len(connections))
-        for row, connection in enumerate(connections):
-            self._table.setItem(row, 0, QtWidgets.QTableWidgetItem(connection.name))
-            self._table.setItem(row, 1, QtWidgets.QTableWidgetItem(connection.type.title()))
-            status_item = QtWidgets.QTableWidgetItem(self._format_status(connection))
-            self._table.setItem(row, 2, status_item)
-            last_used = connection.last_used or "—"
-            self._table.setItem(row, 3, QtWidgets.QTableWidgetItem(last_used))
-            self._table.setCellWidget(row, 4, self._build_actions_widget(connection))
+        self._table.setUpdatesEnabled(False)
+        self._table.blockSignals(True)
+        try:
+            self._table.setRowCount(len(connections))
+            for row, connection in enumerate(connections):
+                self._table.setItem(row, 0, QtWidgets.QTableWidgetItem(connection.name))
+                self._table.setItem(row, 1, QtWidgets.QTableWidgetItem(connection.type.title()))
+                status_item = QtWidgets.QTableWidgetItem(self._format_status(connection))
+                self._table.setItem(row, 2, status_item)
+                last_used = connection.last_used or "—"
+                self._table.setItem(row, 3, QtWidgets.QTableWidgetItem(last_used))
+                self._table.setCellWidget(row, 4, self._build_actions_widget(connection))
+        finally:
+            self._table.blockSignals(False)
+            self._table.setUpdatesEnabled(True)
 
     def _format_status(self, connection: Connection) -> str:
         symbol = {
@@ -390,45 +470,44 @@ class ConnectionsDialog(QtWidgets.QDialog):
         layout = QtWidgets.QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
-
-        toggle_button = QtWidgets.QToolButton()
-        toggle_button.setText("■" if connection.is_active else "▶")
-        toggle_button.setToolTip(
-            translate(
-                "connections.actions.deactivate"
-                if connection.is_active
-                else "connections.actions.activate"
-            )
-        )
-        toggle_button.clicked.connect(
-            lambda _checked=False, conn=connection: self._toggle_connection(conn)
+        toggle_icon = "deactivate" if connection.is_active else "activate"
+        buttons = (
+            ("toggle", toggle_icon, f"connections.actions.{toggle_icon}"),
+            ("edit", "edit", "actions.edit"),
+            ("test", "test", "actions.test_connection"),
+            ("delete", "delete", "actions.delete"),
         )
-        layout.addWidget(toggle_button)
-
-        edit_button = QtWidgets.QToolButton()
-        edit_button.setText("✎")
-        edit_button.setToolTip(translate("actions.edit"))
-        edit_button.clicked.connect(lambda _=False, conn=connection: self._edit_connection(conn))
-        layout.addWidget(edit_button)
-
-        test_button = QtWidgets.QToolButton()
-        test_button.setText("✓")
-        test_button.setToolTip(translate("actions.test_connection"))
-        test_button.clicked.connect(
-            lambda _checked=False, conn=connection: self._run_status_check([conn.identifier])
-        )
-        layout.addWidget(test_button)
-
-        delete_button = QtWidgets.QToolButton()
-        delete_button.setText("🗑")
-        delete_button.setToolTip(translate("actions.delete"))
-        delete_button.clicked.connect(
-            lambda _checked=False, conn=connection: self._delete_connection(conn)
-        )
-        layout.addWidget(delete_button)
-
+        for action, icon_name, tooltip_key in buttons:
+            button = QtWidgets.QToolButton()
+            icon = _action_icon(icon_name)
+            if icon.isNull():
+                button.setText(_ACTION_GLYPHS[icon_name])
+            else:
+                button.setIcon(icon)
+            button.setToolTip(translate(tooltip_key))
+            button.setProperty("conn_id", connection.identifier)
+            button.setProperty("action", action)
+            button.clicked.connect(self._on_action_clicked)
+            layout.addWidget(button)
         return widget
 
+    def _on_action_clicked(self) -> None:
+        button = self.sender()
+        if button is None:
+            return
+        connection = self._conn_by_id.get(str(button.property("conn_id")))
+        if connection is None:
+            return
+        action = button.property("action")
+        if action == "toggle":
+            self._toggle_connection(connection)
+        elif action == "edit":
+            self._edit_connection(connection)
+        elif action == "test":
+            self._run_status_check([connection.identifier])
+        elif action == "delete":
+            self._delete_connection(connection)
+
     def _add_connection(self) -> None:
         dialog = ConnectionFormDialog(parent=self)
         if dialog.exec():
@@ -494,7 +573,13 @@ class ConnectionsDialog(QtWidgets.QDialog):
             if not initial
             else translate("connections.messages.checking")
         )
-        thread = ConnectionTestThread(manager=self._manager, identifiers=ids)
+        # Одна отметка времени на весь прогон проверки вместо вызова на каждый статус;
+        # поток возвращает её вместе со статусом, чтобы ответы прошлого прогона её не путали.
+        thread = ConnectionTestThread(
+            manager=self._manager,
+            identifiers=ids,
+            checked_at=datetime.now(UTC).isoformat(),
+        )
         thread.status_updated.connect(self._on_status_updated)
         thread.finished.connect(lambda: self._status_label.setText(""))
         thread.finished.connect(lambda: setattr(self, "_test_thread", None))
@@ -502,13 +587,14 @@ class ConnectionsDialog(QtWidgets.QDialog):
         self._test_thread = thread
         thread.start()
 
-    def _on_status_updated(self, identifier: str, status: ConnectionStatus) -> None:
-        for connection in self._connections:
-            if connection.identifier == identifier:
-                connection.status = status
-                if status == ConnectionStatus.ONLINE:
-                    connection.last_used = datetime.utcnow().isoformat()
-                break
+    def _on_status_updated(
+        self, identifier: str, status: ConnectionStatus, checked_at: str
+    ) -> None:
+        connection = self._conn_by_id.get(identifier)
+        if connection is not None:
+            connection.status = status
+            if status == ConnectionStatus.ONLINE:
+                connection.last_used = checked_at
         self._refresh_table()
 
     def _build_status_row(self) -> QtWidgets.QHBoxLayout:
@@ -521,13 +607,10 @@ class ConnectionsDialog(QtWidgets.QDialog):
         layout.addWidget(close_button)
         return layout
 
-    def accept(self) -> None:
-        self._save_state()
-        super().accept()
-
-    def reject(self) -> None:
+    def done(self, result: int) -> None:
+        # accept/reject и закрытие окна сходятся в done(): состояние пишется один раз.
         self._save_state()
-        super().reject()
+        super().done(result)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         if self._test_thread is not None:
@@ -537,8 +620,19 @@ class ConnectionsDialog(QtWidgets.QDialog):
         super().closeEvent(event)
 
     def _save_state(self) -> None:
-        self._state_store.setValue("geometry", self.saveGeometry())
-        self._state_store.setValue("header_state", self._table.horizontalHeader().saveState())
+        geometry = self.saveGeometry()
+        header_state = self._table.horizontalHeader().saveState()
+        changed = False
+        if geometry != self._saved_geometry:
+            self._state_store.setValue("geometry", geometry)
+            self._saved_geometry = geometry
+            changed = True
+        if header_state != self._saved_header_state:
+            self._state_store.setValue("header_state", header_state)
+            self._saved_header_state = header_state
+            changed = True
+        if changed:
+            self._state_store.sync()
 
     def _restore_state(self) -> None:
         geometry = self._state_store.value("geometry")
@@ -551,47 +645,60 @@ class ConnectionsDialog(QtWidgets.QDialog):
             self._table.horizontalHeader().restoreState(header_state)
         elif header_state:
             self._table.horizontalHeader().restoreState(QtCore.QByteArray(header_state))
+        self._saved_geometry = self.saveGeometry()
+        self._saved_header_state = self._table.horizontalHeader().saveState()
 
 
 class ConnectionTestThread(QtCore.QThread):
     """Проверяет одно или несколько соединений в отдельном потоке."""
 
-    status_updated = QtCore.Signal(str, ConnectionStatus)
+    # Идентификатор, статус и время запуска прогона (ISO 8601, UTC).
+    status_updated = QtCore.Signal(str, ConnectionStatus, str)
 
     def __init__(
         self,
         *,
         manager: ConnectionManager,
         identifiers: List[str],
+        checked_at: str,
     ) -> None:
         super().__init__()
         self._manager = manager
         self._identifiers = identifiers
+        self._checked_at = checked_at
 
     def run(self) -> None:
         for identifier in self._identifiers:
             if self.isInterruptionRequested():
                 return
             status = self._manager.test_connection(identifier)
-            self.status_updated.emit(identifier, status)
+            self.status_updated.emit(identifier, status, self._checked_at)
 
 
-class ConnectionProbeThread(QtCore.QThread):
-    """Проверка соединения из формы без его сохранения."""
+class ConnectionProbeSignals(QtCore.QObject):
+    """Сигналы проверки соединения из формы (QRunnable не умеет их объявлять)."""
 
     success = QtCore.Signal(str)
     error = QtCore.Signal(str)
+    finished = QtCore.Signal()
 
-    def __init__(self, connection: Connection) -> None:
+
+class ConnectionProbeTask(QtCore.QRunnable):
+    """Проверка соединения из формы без его сохранения в общем пуле потоков."""
+
+    def __init__(self, connection: Connection, signals: ConnectionProbeSignals) -> None:
         super().__init__()
         self._connection = connection
+        self._signals = signals
 
     def run(self) -> None:
         try:
             version = get_docker_version(self._connection)
-            self.success.emit(version)
+            self._signals.success.emit(version)
         except Exception as exc:  # pragma: no cover
-            self.error.emit(str(exc))
+            self._signals.error.emit(str(exc))
+        finally:
+            self._signals.finished.emit()
 
 
 def discover_docker_sockets() -> List[str]:
@@ -602,24 +709,44 @@ def discover_docker_sockets() -> List[str]:
     docker_host = os.environ.get("DOCKER_HOST")
     if docker_host and docker_host.startswith("unix://"):
         candidates.append(Path(docker_host[len("unix://") :]))
-    if platform.system() == "Linux":
-        candidates.extend(Path("/tmp").glob("docker-*.sock"))
+    system = platform.system()
+    if system == "Linux":
+        sockets.extend(_scan_tmp_sockets())
         uid = os.getuid()
         candidates.append(Path(f"/run/user/{uid}/docker.sock"))
         candidates.append(Path(f"/run/user/{uid}/docker-desktop/docker.sock"))
         candidates.append(Path.home() / ".docker" / "desktop" / "docker.sock")
-    if platform.system() == "Darwin":
+    if system == "Darwin":
         candidates.append(Path.home() / ".docker" / "run" / "docker.sock")
         candidates.append(Path.home() / ".docker" / "desktop" / "docker.sock")
-    for path in candidates:
-        socket_path = Path(path).expanduser()
-        if _is_socket(socket_path):
-            sockets.append(normalize_socket_path(str(socket_path)))
+    sockets.extend(
+        normalize_socket_path(str(path)) for path in candidates if _is_socket(path.expanduser())
+    )
     return sorted(set(sockets))
 
 
+def _scan_tmp_sockets() -> List[str]:
+    """Ищет /tmp/docker-*.sock одним проходом scandir, проверяя только подходящие имена."""
+
+    found: List[str] = []
+    try:
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("docker-") and name.endswith(".sock")):
+                    continue
+                try:
+                    if stat.S_ISSOCK(entry.stat(follow_symlinks=True).st_mode):
+                        found.append(normalize_socket_path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return found
+
+
 def _is_socket(path: Path) -> bool:
     try:
-        return path.exists() and stat.S_ISSOCK(path.stat().st_mode)
+        return stat.S_ISSOCK(path.stat().st_mode)
     except OSError:
         return False
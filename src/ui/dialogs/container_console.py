@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import shlex
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import pexpect
@@ -11,6 +12,12 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from src.i18n.translator import translate
 
+CONSOLE_MAX_BLOCKS = 5000
+CONSOLE_READ_SIZE = 65536
+
+# Общий пул для запуска docker exec: потоки переиспользуются между окнами консоли.
+_SPAWN_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="console-spawn")
+
 
 class ContainerConsoleDialog(QtWidgets.QDialog):
     """Диалог, отображающий интерактивный вывод docker exec."""
@@ -28,7 +35,10 @@ class ContainerConsoleDialog(QtWidgets.QDialog):
         self._shell_command = shell_command
         self._docker_host = docker_host
         self._process: Optional[pexpect.spawn[str]] = None
-        self._notifier: Optional[QtCore.QSocketNotifier] = None
+        # PTY опрашивается таймером: QSocketNotifier на «всегда читаемом» PTY грузит CPU.
+        self._read_timer = QtCore.QTimer(self)
+        self._read_timer.setInterval(30)
+        self._read_timer.timeout.connect(self._read_output)
 
         self.setWindowTitle(translate("containers.console.title").format(name=container_name))
         self.resize(900, 600)
@@ -37,6 +47,9 @@ class ContainerConsoleDialog(QtWidgets.QDialog):
         self._output = QtWidgets.QPlainTextEdit()
         self._output.setFont(QtGui.QFont("Monospace", 11))
         self._output.setReadOnly(True)
+        # Ограничиваем историю, чтобы долгие сессии не копили текст без предела.
+        self._output.setMaximumBlockCount(CONSOLE_MAX_BLOCKS)
+        self._output.setCenterOnScroll(False)
         self._output.installEventFilter(self)
         layout.addWidget(self._output)
 
@@ -48,36 +61,49 @@ class ContainerConsoleDialog(QtWidgets.QDialog):
         self._progress.hide()
         layout.addWidget(self._progress)
 
-        self._spawn_thread: Optional[ConsoleSpawnThread] = None
+        self._spawn_future: Optional[Future[pexpect.spawn[str]]] = None
+        self._closing = False
+        self._spawn_signals = ConsoleSpawnSignals()
+        self._spawn_signals.success.connect(self._on_spawn_ready)
+        self._spawn_signals.error.connect(self._on_spawn_error)
         self._start_process_async()
 
     def _start_process_async(self) -> None:
         self._status_label.setText(translate("terminal.messages.connecting"))
         self._progress.show()
         self._output.setDisabled(True)
-        thread = ConsoleSpawnThread(
-            container_id=self._container_id,
-            shell_parts=self._build_docker_command(),
-            docker_host=self._docker_host,
-        )
-        thread.success.connect(self._on_spawn_ready)
-        thread.error.connect(self._on_spawn_error)
-        thread.finished.connect(thread.deleteLater)
-        self._spawn_thread = thread
-        thread.start()
+        shell_parts = self._build_docker_command()
+        command = "docker " + " ".join(shell_parts)
+        signals = self._spawn_signals
+
+        def _on_done(future: Future[pexpect.spawn[str]]) -> None:
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                signals.error.emit(str(exc))
+            else:
+                signals.success.emit(future.result(), command)
+
+        future = _SPAWN_EXECUTOR.submit(_spawn_console, shell_parts, self._docker_host)
+        future.add_done_callback(_on_done)
+        self._spawn_future = future
 
     def _on_spawn_ready(self, process: pexpect.spawn[str], command: str) -> None:
-        self._spawn_thread = None
+        self._spawn_future = None
+        if self._closing:
+            process.close(force=True)
+            return
         self._progress.hide()
         self._output.setDisabled(False)
         self._process = process
-        self._notifier = QtCore.QSocketNotifier(
-            self._process.fileno(), QtCore.QSocketNotifier.Type.Read
-        )
-        self._notifier.activated.connect(self._read_output)
+        self._read_timer.start()
         self._status_label.setText(command)
 
     def _on_spawn_error(self, message: str) -> None:
+        self._spawn_future = None
+        if self._closing:
+            return
         self._progress.hide()
         QtWidgets.QMessageBox.critical(self, translate("terminal.errors.title"), message)
         self.reject()
@@ -97,24 +123,31 @@ class ContainerConsoleDialog(QtWidgets.QDialog):
     def _read_output(self) -> None:
         if not self._process:
             return
+        chunks: List[str] = []
+        finished = False
         try:
             while True:
-                chunk = self._process.read_nonblocking(size=4096, timeout=0)
+                chunk = self._process.read_nonblocking(size=CONSOLE_READ_SIZE, timeout=0)
                 if not chunk:
                     break
-                self._output.moveCursor(QtGui.QTextCursor.MoveOperation.End)
-                self._output.insertPlainText(chunk)
-                self._output.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+                chunks.append(chunk)
         except pexpect.exceptions.TIMEOUT:
             pass
         except pexpect.exceptions.EOF:
+            finished = True
+        if chunks:
+            # Весь прочитанный за проход вывод вставляется одним вызовом.
+            self._output.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+            self._output.insertPlainText("".join(chunks))
+            self._output.ensureCursorVisible()
+        if finished:
             self._append_message(translate("terminal.messages.finished").format(code=0))
             self._cleanup_process()
 
     def _append_message(self, message: str) -> None:
         self._output.moveCursor(QtGui.QTextCursor.MoveOperation.End)
         self._output.insertPlainText("\n" + message + "\n")
-        self._output.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+        self._output.ensureCursorVisible()
 
     # ---------------------------------------------------------------- key input
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
@@ -153,54 +186,39 @@ class ContainerConsoleDialog(QtWidgets.QDialog):
         super().closeEvent(event)
 
     def _cleanup_process(self) -> None:
-        if self._notifier is not None:
-            self._notifier.setEnabled(False)
-            self._notifier.deleteLater()
-            self._notifier = None
+        self._read_timer.stop()
         if self._process is not None:
             if self._process.isalive():
                 self._process.terminate()
             self._process.close(force=True)
             self._process = None
-        if self._spawn_thread is not None:
-            self._spawn_thread.quit()
-            self._spawn_thread.wait(1000)
-            self._spawn_thread = None
+        if self._spawn_future is not None:
+            # Если запуск ещё идёт, готовый процесс будет закрыт в _on_spawn_ready.
+            self._closing = True
+            self._spawn_future.cancel()
+
 
+class ConsoleSpawnSignals(QtCore.QObject):
+    """Передаёт результат запуска из пула потоков в поток интерфейса."""
 
-class ConsoleSpawnThread(QtCore.QThread):
     success = QtCore.Signal(object, str)
     error = QtCore.Signal(str)
 
-    def __init__(
-        self, *, container_id: str, shell_parts: List[str], docker_host: str | None
-    ) -> None:
-        super().__init__()
-        self._container_id = container_id
-        self._shell_parts = shell_parts
-        self._docker_host = docker_host
-        self._process: Optional[pexpect.spawn[str]] = None
 
-    def run(self) -> None:
-        previous_host = os.environ.get("DOCKER_HOST")
-        try:
-            if self._docker_host:
-                os.environ["DOCKER_HOST"] = self._docker_host
-            else:
-                os.environ.pop("DOCKER_HOST", None)
-            process = pexpect.spawn(
-                "docker",
-                self._shell_parts,
-                encoding="utf-8",
-                echo=False,
-                timeout=None,
-            )
-            self._process = process
-            self.success.emit(process, "docker " + " ".join(self._shell_parts))
-        except Exception as exc:  # pragma: no cover - зависит от окружения
-            self.error.emit(str(exc))
-        finally:
-            if previous_host is not None:
-                os.environ["DOCKER_HOST"] = previous_host
-            else:
-                os.environ.pop("DOCKER_HOST", None)
+def _spawn_console(shell_parts: List[str], docker_host: str | None) -> pexpect.spawn[str]:
+    """Запускает docker exec через pexpect (выполняется в _SPAWN_EXECUTOR)."""
+
+    # Окружение передаётся процессу явно: os.environ общий для всех потоков пула.
+    env = dict(os.environ)
+    if docker_host:
+        env["DOCKER_HOST"] = docker_host
+    else:
+        env.pop("DOCKER_HOST", None)
+    return pexpect.spawn(
+        "docker",
+        shell_parts,
+        encoding="utf-8",
+        echo=False,
+        timeout=None,
+        env=env,
+    )
@@ -4,18 +4,173 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, Iterable
+from array import array
+from bisect import bisect_right
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from src.i18n.translator import translate
 
+orjson: Any
+try:  # pragma: no cover - orjson необязателен, ускоряет форматирование inspect
+    import orjson as _orjson_module
+
+    orjson = _orjson_module
+except ImportError:  # pragma: no cover - используем стандартный json
+    orjson = None
+
 
 LOG_PREFIX_RE = re.compile(
     r"^\s*(\[[^\]]+\]|\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}(?:[.,]\d+)?)(\s*\|\s*|\s+[-:]\s+)"
 )
 
 
+def _is_decimal_run(text: str, start: int, count: int) -> bool:
+    return len(text) >= start + count and text[start : start + count].isdecimal()
+
+
+def _strip_log_prefix(line: str) -> str:
+    """Убирает префикс времени так же, как LOG_PREFIX_RE.sub, но без движка регулярок."""
+
+    stripped = line.lstrip()
+    if not stripped:
+        return line
+    first = stripped[0]
+    if first == "[":
+        end = stripped.find("]", 1)
+        if end <= 1:
+            return line
+        position = end + 1
+    elif first.isdecimal():
+        # YYYY-MM-DD<пробелы>HH:MM:SS[.fraction]
+        if not (
+            _is_decimal_run(stripped, 0, 4)
+            and stripped[4:5] == "-"
+            and _is_decimal_run(stripped, 5, 2)
+            and stripped[7:8] == "-"
+            and _is_decimal_run(stripped, 8, 2)
+        ):
+            return line
+        position = 10
+        length = len(stripped)
+        while position < length and stripped[position].isspace():
+            position += 1
+        if position == 10 or not (
+            _is_decimal_run(stripped, position, 2)
+            and stripped[position + 2 : position + 3] == ":"
+            and _is_decimal_run(stripped, position + 3, 2)
+            and stripped[position + 5 : position + 6] == ":"
+            and _is_decimal_run(stripped, position + 6, 2)
+        ):
+            return line
+        position += 8
+        if stripped[position : position + 1] in (".", ",") and _is_decimal_run(
+            stripped, position + 1, 1
+        ):
+            position += 2
+            while position < length and stripped[position].isdecimal():
+                position += 1
+    else:
+        return line
+    rest = stripped[position:]
+    body = rest.lstrip()
+    if body.startswith("|"):
+        return body[1:].lstrip()
+    if body and len(body) < len(rest) and body[0] in "-:" and body[1:2].isspace():
+        return body[1:].lstrip()
+    return line
+
+
+def _normalize_logs(logs: str) -> str:
+    """Приводит переводы строк к \\n и убирает завершающий перевод строки."""
+
+    if not logs:
+        return ""
+    if "\r" in logs:
+        logs = logs.replace("\r\n", "\n").replace("\r", "\n")
+    return logs[:-1] if logs.endswith("\n") else logs
+
+
+def _line_starts(text: str) -> array[int]:
+    """Смещения начала каждой строки плюс граничное значение len(text) + 1."""
+
+    starts = array("q", [0])
+    if not text:
+        return starts
+    find = text.find
+    position = find("\n")
+    while position >= 0:
+        starts.append(position + 1)
+        position = find("\n", position + 1)
+    starts.append(len(text) + 1)
+    return starts
+
+
+def _matching_lines(lower: str, starts: array[int], search: str) -> Iterator[int]:
+    """Индексы строк, содержащих search: str.find по всему буферу и bisect по смещениям."""
+
+    find = lower.find
+    position = find(search)
+    while position >= 0:
+        index = bisect_right(starts, position) - 1
+        yield index
+        # Остаток строки уже не нужен — ищем со следующей.
+        position = find(search, starts[index + 1])
+
+
+_TOP_LEVEL_KEY_RE = re.compile(r'^  ("(?:[^"\\]|\\.)*"):', re.MULTILINE)
+
+
+def _section_offsets(pretty: str) -> Dict[str, tuple[int, int]]:
+    """Позиции ключей верхнего уровня в JSON с отступом 2 (в единицах QTextDocument)."""
+
+    offsets: Dict[str, tuple[int, int]] = {}
+    # QTextDocument считает позиции в UTF-16; для ASCII они совпадают с индексами str.
+    is_ascii = pretty.isascii()
+    consumed = 0
+    position = 0
+    for match in _TOP_LEVEL_KEY_RE.finditer(pretty):
+        quoted = match.group(1)
+        start = match.start(1)
+        length = len(quoted)
+        if not is_ascii:
+            position += len(pretty[consumed:start].encode("utf-16-le")) // 2
+            consumed = start
+            start = position
+            length = len(quoted.encode("utf-16-le")) // 2
+        key = json.loads(quoted)
+        offsets.setdefault(key, (start, start + length))
+    return offsets
+
+
+_SETTINGS_CACHE: Dict[str, Any] | None = None
+
+
+def _open_settings() -> QtCore.QSettings:
+    return QtCore.QSettings("docker-simple-manager", "ContainerDetailsDialog")
+
+
+def _settings_cache() -> Dict[str, Any]:
+    """Состояние диалога, прочитанное из QSettings один раз за сессию."""
+
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is None:
+        store = _open_settings()
+        _SETTINGS_CACHE = {key: store.value(key) for key in store.allKeys()}
+    return _SETTINGS_CACHE
+
+
+def _flush_settings() -> None:
+    if _SETTINGS_CACHE is None:
+        return
+    store = _open_settings()
+    for key, value in _SETTINGS_CACHE.items():
+        store.setValue(key, value)
+    store.sync()
+
+
 class ContainerDetailsDialog(QtWidgets.QDialog):
     """Отображает вкладки с логами, inspect и bind mounts."""
 
@@ -31,9 +186,13 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         self.setWindowTitle(translate("containers.details.title").format(name=container_name))
         self.resize(950, 620)
 
-        self._raw_logs = logs.splitlines() if logs else []
+        # Логи хранятся одной строкой и массивом смещений начала строк, без списка строк.
+        self._logs_text = _normalize_logs(logs)
+        self._line_starts = _line_starts(self._logs_text)
+        lowered = self._logs_text.lower()
+        self._logs_lower = lowered if len(lowered) == len(self._logs_text) else None
         self._inspect_data = inspect_data or {}
-        self._settings = QtCore.QSettings("docker-simple-manager", "ContainerDetailsDialog")
+        self._settings = _settings_cache()
 
         layout = QtWidgets.QVBoxLayout(self)
         self._tabs = QtWidgets.QTabWidget()
@@ -61,7 +220,12 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         controls = QtWidgets.QHBoxLayout()
         self._log_search = QtWidgets.QLineEdit()
         self._log_search.setPlaceholderText(translate("containers.logs.search"))
-        self._log_search.textChanged.connect(self._refresh_logs_view)
+        # Ввод в поиск объединяется таймером, чтобы не фильтровать логи на каждую клавишу.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._refresh_logs_view)
+        self._log_search.textChanged.connect(lambda _text: self._search_timer.start())
         controls.addWidget(self._log_search, stretch=2)
 
         self._hide_timestamp = QtWidgets.QCheckBox(translate("containers.logs.hide_timestamp"))
@@ -74,33 +238,54 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         controls.addStretch()
         layout.addLayout(controls)
 
-        self._logs_view = QtWidgets.QPlainTextEdit()
-        self._logs_view.setReadOnly(True)
+        # Список с моделью отрисовывает только видимые строки, в отличие от QPlainTextEdit.
+        self._filtered_logs: List[str] = []
+        self._logs_model = QtCore.QStringListModel(self)
+        self._logs_view = QtWidgets.QListView()
+        self._logs_view.setModel(self._logs_model)
+        self._logs_view.setUniformItemSizes(True)
+        self._logs_view.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._logs_view.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection
+        )
         layout.addWidget(self._logs_view)
         self._refresh_logs_view()
         return widget
 
     def _refresh_logs_view(self) -> None:
-        if not self._raw_logs:
-            self._logs_view.setPlainText(translate("containers.details.no_logs"))
+        if not self._logs_text:
+            self._filtered_logs = []
+            self._logs_model.setStringList([translate("containers.details.no_logs")])
             return
         search = self._log_search.text().lower()
-        filtered: Iterable[str]
+        text = self._logs_text
+        starts = self._line_starts
+        bounds = zip(starts, starts[1:])
+        lines: Iterable[str]
         if search:
-            filtered = [line for line in self._raw_logs if search in line.lower()]
+            lower = self._logs_lower
+            if lower is not None:
+                lines = (
+                    text[starts[index] : starts[index + 1] - 1]
+                    for index in _matching_lines(lower, starts, search)
+                )
+            else:
+                lines = (
+                    line
+                    for line in (text[start : end - 1] for start, end in bounds)
+                    if search in line.lower()
+                )
         else:
-            filtered = self._raw_logs
-
-        def format_line(line: str) -> str:
-            if self._hide_timestamp.isChecked():
-                line = LOG_PREFIX_RE.sub("", line)
-            return line
-
-        text = "\n".join(format_line(line) for line in filtered)
-        self._logs_view.setPlainText(text or translate("containers.details.no_logs"))
+            lines = (text[start : end - 1] for start, end in bounds)
+        if self._hide_timestamp.isChecked():
+            lines = map(_strip_log_prefix, lines)
+        self._filtered_logs = list(lines)
+        self._logs_model.setStringList(
+            self._filtered_logs or [translate("containers.details.no_logs")]
+        )
 
     def _copy_logs_to_clipboard(self) -> None:
-        QtWidgets.QApplication.clipboard().setText(self._logs_view.toPlainText())
+        QtWidgets.QApplication.clipboard().setText("\n".join(self._filtered_logs))
 
     # -------------------------------------------------------------- inspect tab
     def _create_inspect_tab(self) -> QtWidgets.QWidget:
@@ -127,7 +312,15 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         self._inspect_tree = QtWidgets.QTreeWidget()
         self._inspect_tree.setColumnCount(2)
         self._inspect_tree.setHeaderLabels(["Key", "Value"])
+        # Нераскрытые поддеревья остаются Python-объектами: в UserRole хранится только
+        # ключ, иначе Qt конвертирует их в QVariantMap (сортирует ключи, копирует всё
+        # поддерево и падает на int вне int64).
+        self._pending_subtrees: Dict[int, Any] = {}
+        self._subtree_ids = count()
+        self._inspect_tree.itemExpanded.connect(self._expand_item)
+        self._inspect_tree.setUpdatesEnabled(False)
         self._populate_tree(self._inspect_tree.invisibleRootItem(), self._inspect_data)
+        self._inspect_tree.setUpdatesEnabled(True)
         self._inspect_tree.header().setSectionResizeMode(
             0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents
         )
@@ -136,11 +329,11 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         )
         self._inspect_stack.addWidget(self._inspect_tree)
 
-        # Raw view
-        pretty = json.dumps(self._inspect_data, indent=2, ensure_ascii=False)
+        # Raw view: JSON форматируется при первом переключении в этот режим.
+        self._inspect_pretty_cached: str | None = None
+        self._section_offsets: Dict[str, tuple[int, int]] = {}
         self._inspect_text = QtWidgets.QPlainTextEdit()
         self._inspect_text.setReadOnly(True)
-        self._inspect_text.setPlainText(pretty or "{}")
         self._inspect_stack.addWidget(self._inspect_text)
 
         self._inspect_raw_checkbox.setChecked(False)
@@ -150,21 +343,49 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
     def _populate_tree(
         self, parent: QtWidgets.QTreeWidgetItem, value: Any, key: str | None = None
     ) -> None:
+        """Заполняет один уровень дерева; вложенные узлы раскрываются по требованию."""
+
+        tree_item = QtWidgets.QTreeWidgetItem
         if isinstance(value, dict):
-            for sub_key, sub_value in value.items():
-                item = QtWidgets.QTreeWidgetItem(parent, [str(sub_key), ""])
-                self._populate_tree(item, sub_value, sub_key)
+            pairs: Iterable[tuple[str, Any]] = (
+                (str(sub_key), sub_value) for sub_key, sub_value in value.items()
+            )
         elif isinstance(value, list):
-            for index, sub_value in enumerate(value):
-                item = QtWidgets.QTreeWidgetItem(parent, [f"[{index}]", ""])
-                self._populate_tree(item, sub_value, f"[{index}]")
+            pairs = ((f"[{index}]", sub_value) for index, sub_value in enumerate(value))
         else:
-            text = (
-                json.dumps(value, ensure_ascii=False)
-                if isinstance(value, (dict, list))
-                else str(value)
-            )
-            QtWidgets.QTreeWidgetItem(parent, [key or "", text])
+            tree_item(parent, [key or "", str(value)])
+            return
+        user_role = QtCore.Qt.ItemDataRole.UserRole
+        pending = self._pending_subtrees
+        show_indicator = tree_item.ChildIndicatorPolicy.ShowIndicator
+        children: List[QtWidgets.QTreeWidgetItem] = []
+        for sub_key, sub_value in pairs:
+            if isinstance(sub_value, (dict, list)):
+                item = tree_item([sub_key, ""])
+                subtree_id = next(self._subtree_ids)
+                pending[subtree_id] = sub_value
+                item.setData(0, user_role, subtree_id)
+                item.setChildIndicatorPolicy(show_indicator)
+            else:
+                item = tree_item([sub_key, str(sub_value)])
+            children.append(item)
+        # Один addChildren вместо вставки и уведомления модели на каждый элемент.
+        parent.addChildren(children)
+
+    def _expand_item(self, item: QtWidgets.QTreeWidgetItem) -> None:
+        subtree_id = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if subtree_id is None:
+            return
+        item.setData(0, QtCore.Qt.ItemDataRole.UserRole, None)
+        value = self._pending_subtrees.pop(subtree_id)
+        item.setChildIndicatorPolicy(
+            QtWidgets.QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        )
+        self._inspect_tree.setUpdatesEnabled(False)
+        try:
+            self._populate_tree(item, value)
+        finally:
+            self._inspect_tree.setUpdatesEnabled(True)
 
     def _populate_section_combo(self) -> None:
         self._inspect_section_combo.blockSignals(True)
@@ -176,6 +397,10 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
 
     def _toggle_inspect_view(self) -> None:
         is_raw = self._inspect_raw_checkbox.isChecked()
+        if is_raw and self._inspect_pretty_cached is None:
+            self._inspect_pretty_cached = _dump_pretty_json(self._inspect_data) or "{}"
+            self._inspect_text.setPlainText(self._inspect_pretty_cached)
+            self._section_offsets = _section_offsets(self._inspect_pretty_cached)
         self._inspect_stack.setCurrentWidget(self._inspect_text if is_raw else self._inspect_tree)
 
     def _jump_to_section(self, index: int) -> None:
@@ -184,6 +409,15 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         key = self._inspect_section_combo.itemText(index)
         if not key:
             return
+        offsets = self._section_offsets.get(key)
+        if offsets is not None:
+            start, end = offsets
+            cursor = QtGui.QTextCursor(self._inspect_text.document())
+            cursor.setPosition(start)
+            cursor.setPosition(end, QtGui.QTextCursor.MoveMode.KeepAnchor)
+            self._inspect_text.setTextCursor(cursor)
+            self._inspect_text.centerCursor()
+            return
         pattern = f'"{key}"'
         cursor = self._inspect_text.textCursor()
         cursor.movePosition(QtGui.QTextCursor.MoveOperation.Start)
@@ -214,13 +448,19 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
             ]
         )
         table.setRowCount(len(mounts))
-        for row_index, mount in enumerate(mounts):
-            source = mount.get("Source") or mount.get("HostPath") or "-"
-            destination = mount.get("Destination") or mount.get("Target") or "-"
-            mount_type = mount.get("Type") or "-"
-            table.setItem(row_index, 0, QtWidgets.QTableWidgetItem(str(source)))
-            table.setItem(row_index, 1, QtWidgets.QTableWidgetItem(str(destination)))
-            table.setItem(row_index, 2, QtWidgets.QTableWidgetItem(str(mount_type)))
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for row_index, mount in enumerate(mounts):
+                source = mount.get("Source") or mount.get("HostPath") or "-"
+                destination = mount.get("Destination") or mount.get("Target") or "-"
+                mount_type = mount.get("Type") or "-"
+                table.setItem(row_index, 0, QtWidgets.QTableWidgetItem(str(source)))
+                table.setItem(row_index, 1, QtWidgets.QTableWidgetItem(str(destination)))
+                table.setItem(row_index, 2, QtWidgets.QTableWidgetItem(str(mount_type)))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
         table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
         layout.addWidget(table)
         return widget
@@ -230,15 +470,17 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
         super().closeEvent(event)
 
     def _save_state(self) -> None:
-        self._settings.setValue("geometry", self.saveGeometry())
-        self._settings.setValue("tab_index", self._tabs.currentIndex())
-        self._settings.setValue("inspect_raw", self._inspect_raw_checkbox.isChecked())
+        self._settings["geometry"] = self.saveGeometry()
+        self._settings["tab_index"] = self._tabs.currentIndex()
+        self._settings["inspect_raw"] = self._inspect_raw_checkbox.isChecked()
+        # Запись на диск выполняется после возврата из closeEvent.
+        QtCore.QTimer.singleShot(0, _flush_settings)
 
     def _restore_state(self) -> None:
-        geometry = self._settings.value("geometry")
+        geometry = self._settings.get("geometry")
         if geometry is not None:
             self.restoreGeometry(geometry)
-        raw_index = self._settings.value("tab_index", 0)
+        raw_index = self._settings.get("tab_index", 0)
         if isinstance(raw_index, int):
             tab_index = raw_index
         elif isinstance(raw_index, str) and raw_index.isdigit():
@@ -247,5 +489,16 @@ class ContainerDetailsDialog(QtWidgets.QDialog):
             tab_index = 0
         if 0 <= tab_index < self._tabs.count():
             self._tabs.setCurrentIndex(tab_index)
-        raw = self._settings.value("inspect_raw", False)
-        self._inspect_raw_checkbox.setChecked(bool(raw))
+        raw = self._settings.get("inspect_raw", False)
+        self._inspect_raw_checkbox.setChecked(raw is True or str(raw).lower() == "true")
+
+
+def _dump_pretty_json(data: Any) -> str:
+    """Форматирует данные inspect с отступом 2, через orjson при его наличии."""
+
+    if orjson is not None:
+        try:
+            return str(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
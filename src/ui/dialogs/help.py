@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -23,6 +24,7 @@ class HelpDialog(QtWidgets.QDialog):
         self._language = language.lower()
         self._resources_dir = resources_dir
         self._search_position = 0
+        self._plain_utf16: bytes | None = b""
         self._text_browser = QtWidgets.QTextBrowser()
         self._search_edit = QtWidgets.QLineEdit()
         self._search_button = QtWidgets.QPushButton(translate("help.search"))
@@ -62,12 +64,19 @@ class HelpDialog(QtWidgets.QDialog):
             self._status_label.setText(str(file_path))
             return
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = _read_text_mapped(file_path)
         except OSError as exc:  # pragma: no cover - файловые ошибки
             self._text_browser.setPlainText(translate("help.errors.load_failed").format(error=exc))
             self._status_label.setText(str(file_path))
             return
         self._text_browser.setMarkdown(content)
+        # Курсор документа считает позиции в UTF-16, поэтому ищем прямо в UTF-16 байтах:
+        # с эмодзи и другими символами вне BMP индексы str со смещениями курсора расходятся.
+        plain = self._text_browser.toPlainText()
+        lowered = plain.lower()
+        # lower() может удлинить текст (например, «İ»), тогда смещения не совпадут с документом
+        # и поиск идёт через QTextDocument.find.
+        self._plain_utf16 = lowered.encode("utf-16-le") if len(lowered) == len(plain) else None
         self._status_label.setText(str(file_path))
         self._text_browser.moveCursor(QtGui.QTextCursor.MoveOperation.Start)
 
@@ -76,18 +85,54 @@ class HelpDialog(QtWidgets.QDialog):
         if not query:
             self._status_label.setText(translate("help.search.enter_query"))
             return
+        current = self._text_browser.textCursor()
+        start = current.selectionEnd() if current.hasSelection() else 0
+        if self._plain_utf16 is None:
+            self._find_in_document(query, start)
+            return
+        needle = query.lower().encode("utf-16-le")
+        position = _find_utf16(self._plain_utf16, needle, start)
+        if position < 0:
+            position = _find_utf16(self._plain_utf16, needle, 0)
+            if position < 0:
+                self._status_label.setText(translate("help.search.not_found"))
+                return
+        self._search_position = position
+        cursor = QtGui.QTextCursor(self._text_browser.document())
+        cursor.setPosition(position)
+        cursor.setPosition(position + len(needle) // 2, QtGui.QTextCursor.MoveMode.KeepAnchor)
+        self._text_browser.setTextCursor(cursor)
+        self._status_label.setText("")
+
+    def _find_in_document(self, query: str, start: int) -> None:
         document = self._text_browser.document()
-        cursor = self._text_browser.textCursor()
-        if cursor.isNull() or not cursor.hasSelection():
-            cursor = QtGui.QTextCursor(document)
-            cursor.setPosition(0)
-        found = document.find(query, cursor)
-        if not found:
-            cursor = QtGui.QTextCursor(document)
-            cursor.setPosition(0)
-            found = document.find(query, cursor)
-            if not found:
+        # Без FindCaseSensitively поиск QTextDocument не учитывает регистр.
+        cursor = document.find(query, start)
+        if cursor.isNull():
+            cursor = document.find(query, 0)
+            if cursor.isNull():
                 self._status_label.setText(translate("help.search.not_found"))
                 return
-        self._text_browser.setTextCursor(found)
+        self._search_position = cursor.selectionStart()
+        self._text_browser.setTextCursor(cursor)
         self._status_label.setText("")
+
+
+def _find_utf16(haystack: bytes, needle: bytes, start: int) -> int:
+    """Ищет needle в UTF-16LE тексте, позиции в кодовых единицах UTF-16 (как у QTextCursor)."""
+
+    index = haystack.find(needle, start * 2)
+    # Совпадение с нечётного байта пересекает границу символов и не считается.
+    while index >= 0 and index % 2:
+        index = haystack.find(needle, index + 1)
+    return -1 if index < 0 else index // 2
+
+
+def _read_text_mapped(file_path: Path) -> str:
+    """Читает UTF-8 файл через mmap, декодируя прямо из отображённой памяти."""
+
+    with file_path.open("rb") as handle:
+        if handle.seek(0, 2) == 0:
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import logging
+import mmap
+import multiprocessing
+import os
 import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import List
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
 
 from PySide6 import QtCore, QtWidgets
 
 from src.i18n.translator import translate
 
-
 LOG_PATTERNS = [
     re.compile(r"\[(?P<timestamp>[^\]]+)\]\s+(?P<level>[A-Z]+)\s+[-:]\s+(?P<message>.+)"),
     re.compile(
@@ -21,6 +31,54 @@ LOG_PATTERNS = [
     ),
 ]
 SUPPORTED_LEVELS = ["ALL", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+LOG_READ_BLOCK_SIZE = 1 << 20  # Размер блока чтения лог-файла, байт
+LOG_MMAP_THRESHOLD = 4 << 20  # С какого размера файл читается через mmap
+# С какого размера файл разбирается в нескольких процессах. Порог намеренно высокий:
+# на файле 103 MiB последовательный разбор занимает ~3.5 с, а одна распаковка готовых
+# записей из дочерних процессов в главном — ~5 с (плюс запуск spawn-процессов с PySide6).
+LOG_PARALLEL_THRESHOLD = 1 << 30
+LOG_FETCH_BATCH = 500  # Сколько строк таблица получает за раз при прокрутке
+LOG_PARSE_CACHE_SIZE = 8  # Сколько разобранных файлов диалог держит в памяти
+
+# Один объект строки на уровень вместо новой строки в каждой записи.
+_LEVEL_NAMES: Dict[str, str] = {level: sys.intern(level) for level in SUPPORTED_LEVELS}
+_LEVEL_NAMES_LIMIT = 256  # Защита от роста словаря на «уровнях» из мусорных строк
+
+
+def _branch_source(pattern: re.Pattern[str], branch: int) -> str:
+    """Готовит шаблон к многострочному поиску: без переходов через \\n и с уникальными группами."""
+
+    source = pattern.pattern.replace(r"\s", r"[^\S\n]").replace(r"[^\]]", r"[^\]\n]")
+    return re.sub(r"\(\?P<(\w+)>", rf"(?P<\1_{branch}>", source)
+
+
+@lru_cache(maxsize=None)
+def _combined_pattern(
+    order: Tuple[int, ...],
+) -> Tuple[re.Pattern[str], Dict[str, Tuple[int, Tuple[int, int, int]]]]:
+    """Все шаблоны в одном выражении (ветки в порядке order) для разбора одним finditer.
+
+    Второй элемент: последняя группа ветки -> номер шаблона и индексы его групп
+    timestamp/level/message.
+    """
+
+    combined = re.compile(
+        "(?m)^(?:"
+        + "|".join(_branch_source(LOG_PATTERNS[index], index) for index in order)
+        + "|(?P<unparsed>.*))$"
+    )
+    branches = {
+        f"message_{index}": (
+            index,
+            (
+                combined.groupindex[f"timestamp_{index}"],
+                combined.groupindex[f"level_{index}"],
+                combined.groupindex[f"message_{index}"],
+            ),
+        )
+        for index in order
+    }
+    return combined, branches
 
 
 @dataclass(slots=True)
@@ -32,6 +90,8 @@ class LogEntry:
     timestamp: datetime | None
     level: str
     message: str
+    # Время в целых секундах для сравнения в фильтре по датам; -1 — метки нет.
+    ts_epoch: int = -1
 
     @property
     def timestamp_text(self) -> str:
@@ -40,6 +100,329 @@ class LogEntry:
         return "-"
 
 
+def _normalize_newlines(text: str) -> str:
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_log_text(path: Path) -> str:
+    """Читает лог-файл и приводит переводы строк к \\n."""
+
+    return _normalize_newlines(path.read_text(encoding="utf-8", errors="ignore"))
+
+
+def _iter_log_blocks(path: Path) -> Iterator[str]:
+    """Читает файл блоками, каждый из которых заканчивается на границе строки."""
+
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size >= LOG_MMAP_THRESHOLD:
+            yield from _iter_mapped_blocks(handle)
+            return
+        pending: List[bytes] = []  # Начало строки, не уместившейся в прошлый блок
+        while chunk := handle.read(LOG_READ_BLOCK_SIZE):
+            cut = chunk.rfind(b"\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            yield _normalize_newlines(b"".join(pending).decode("utf-8", errors="ignore"))
+            pending = [chunk[cut:]] if cut < len(chunk) else []
+        if pending:
+            yield _normalize_newlines(b"".join(pending).decode("utf-8", errors="ignore"))
+
+
+def _iter_mapped_blocks(handle: BinaryIO) -> Iterator[str]:
+    """Блоки большого файла прямо из отображения в память, без промежуточных буферов."""
+
+    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mapped)
+        start = 0
+        while start < size:
+            end = min(start + LOG_READ_BLOCK_SIZE, size)
+            if end < size:
+                cut = mapped.rfind(b"\n", start, end) + 1
+                if not cut:
+                    # Строка длиннее блока — берём её целиком.
+                    newline = mapped.find(b"\n", end)
+                    cut = size if newline == -1 else newline + 1
+                end = cut
+            yield _normalize_newlines(mapped[start:end].decode("utf-8", errors="ignore"))
+            start = end
+
+
+def _read_log_entries(path: Path) -> List[LogEntry]:
+    """Потоково разбирает лог-файл, не держа в памяти весь его текст целиком."""
+
+    size = path.stat().st_size
+    workers = os.cpu_count() or 1
+    if size > LOG_PARALLEL_THRESHOLD and workers > 1:
+        try:
+            return _read_log_entries_parallel(path, size, workers)
+        except Exception:  # pragma: no cover - процессы недоступны или упали
+            logging.getLogger(__name__).warning(
+                "Parallel parsing of %s failed, falling back to sequential", path, exc_info=True
+            )
+    entries: List[LogEntry] = []
+    parser = _LogParser()
+    try:
+        for block in _iter_log_blocks(path):
+            entries.extend(parser.parse(block, len(entries)))
+    finally:
+        _timestamp_fields.cache_clear()
+    return entries
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    # fromisoformat в разы быстрее strptime и понимает типичные «YYYY-MM-DD HH:MM:SS[,ffffff]»;
+    # strptime остаётся для нестрогих вариантов вроде нескольких пробелов или «2024-1-5».
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S,%f"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """Целые секунды от datetime.min по «настенному» времени записи (часовой пояс отбрасывается)."""
+
+    return (value.replace(tzinfo=None) - datetime.min) // timedelta(seconds=1)
+
+
+# В логах подряд идут тысячи строк с одинаковой до секунды меткой времени.
+@lru_cache(maxsize=1 << 16)
+def _timestamp_fields(value: str) -> Tuple[datetime | None, int]:
+    """Метка времени и её значение в секундах (-1, если строку разобрать не удалось)."""
+
+    timestamp = _parse_timestamp(value)
+    return timestamp, -1 if timestamp is None else _epoch_seconds(timestamp)
+
+
+def _split_on_lines(path: Path, size: int, parts: int) -> List[Tuple[int, int]]:
+    """Делит файл на диапазоны байт примерно равного размера по границам строк."""
+
+    bounds = [0]
+    with path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for part in range(1, parts):
+                newline = mapped.find(b"\n", max(size * part // parts, bounds[-1]))
+                if newline == -1:
+                    break
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _parse_log_range(path: str, start: int, end: int) -> List[LogEntry]:
+    """Разбирает диапазон байт файла; выполняется в отдельном процессе."""
+
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    return _parse_log_text(_normalize_newlines(data.decode("utf-8", errors="ignore")))
+
+
+def _read_log_entries_parallel(path: Path, size: int, workers: int) -> List[LogEntry]:
+    """Разбирает большой файл частями в пуле процессов и склеивает записи по порядку."""
+
+    ranges = _split_on_lines(path, size, workers)
+    entries: List[LogEntry] = []
+    # spawn: fork процесса с потоками Qt небезопасен.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as executor:
+        futures = [executor.submit(_parse_log_range, str(path), *bounds) for bounds in ranges]
+        for future in futures:
+            chunk = future.result()
+            offset = len(entries)
+            if offset:
+                for entry in chunk:
+                    entry.line_no += offset
+            entries.extend(chunk)
+    return entries
+
+
+def _build_search_index(entries: List[LogEntry]) -> Tuple[str, array[int]]:
+    """Склеивает сообщения в один буфер через \\n и запоминает смещения их начала."""
+
+    haystack = "\n".join(entry.message for entry in entries)
+    # Последнее смещение len(haystack) + 1 служит границей для последней записи.
+    starts = array("q", accumulate((len(entry.message) + 1 for entry in entries), initial=0))
+    return haystack, starts
+
+
+def _matching_entries(haystack: str, starts: array[int], needle: str) -> List[int]:
+    """Индексы записей, содержащих needle без учёта регистра (поиск по буферу и bisect)."""
+
+    hits: List[int] = []
+    # Регистр учитывает сам движок re: ни буфер, ни строка поиска не переводятся в нижний.
+    search = re.compile(re.escape(needle), re.IGNORECASE).search
+    match = search(haystack)
+    while match is not None:
+        index = bisect_right(starts, match.start()) - 1
+        hits.append(index)
+        # Остаток сообщения уже не нужен — ищем со следующей записи.
+        match = search(haystack, starts[index + 1])
+    return hits
+
+
+class _LogParser:
+    """Разбирает блоки одного файла, ставя первым шаблон, который чаще совпадает."""
+
+    def __init__(self) -> None:
+        self._order = tuple(range(len(LOG_PATTERNS)))
+        self._hits = [0] * len(LOG_PATTERNS)
+
+    def parse(self, text: str, first_line_no: int = 0) -> List[LogEntry]:
+        if not text:
+            return []
+        combined, branches = _combined_pattern(self._order)
+        hits = self._hits
+        level_names = _LEVEL_NAMES
+        timestamp_fields = _timestamp_fields
+        # Пустая «строка» после завершающего перевода строки записью не считается.
+        end = len(text) - 1 if text.endswith("\n") else len(text)
+        entries: List[LogEntry] = []
+        append = entries.append
+        for line_no, match in enumerate(combined.finditer(text, 0, end), first_line_no):
+            line = match.group()
+            branch = branches.get(match.lastgroup or "")
+            if branch is None:
+                append(
+                    LogEntry(line_no=line_no, raw=line, timestamp=None, level="INFO", message=line)
+                )
+                continue
+            index, groups = branch
+            hits[index] += 1
+            timestamp_text, level_text, message = match.group(*groups)
+            timestamp, ts_epoch = timestamp_fields(timestamp_text)
+            level = level_names.get(level_text)
+            if level is None:
+                level = sys.intern(level_text.upper())
+                if len(level_names) < _LEVEL_NAMES_LIMIT:
+                    level_names[level_text] = level
+            append(
+                LogEntry(
+                    line_no=line_no,
+                    raw=line,
+                    timestamp=timestamp,
+                    level=level,
+                    message=message.strip(),
+                    ts_epoch=ts_epoch,
+                )
+            )
+        # Для следующего блока: на однородных логах неподходящая ветка не пробуется первой.
+        self._order = tuple(sorted(self._order, key=lambda index: -hits[index]))
+        return entries
+
+
+def _parse_log_text(text: str, first_line_no: int = 0) -> List[LogEntry]:
+    """Разбирает текст лога в записи, по одной на каждую строку."""
+
+    return _LogParser().parse(text, first_line_no)
+
+
+class LogTableModel(QtCore.QAbstractTableModel):
+    """Модель таблицы логов: Qt запрашивает данные только для видимых строк.
+
+    Строки отдаются порциями через canFetchMore/fetchMore по мере прокрутки.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: List[LogEntry] = []
+        self._loaded = 0  # Сколько строк уже показано представлению
+        self._headers = [
+            translate("logs.column.timestamp"),
+            translate("logs.column.level"),
+            translate("logs.column.message"),
+        ]
+
+    def set_entries(self, entries: List[LogEntry]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self._loaded = min(len(entries), LOG_FETCH_BATCH)
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._entries)
+
+    def fetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(len(self._entries) - self._loaded, LOG_FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(
+        self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return entry.timestamp_text
+            if column == 1:
+                return entry.level
+            return entry.message
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class LogParseSignals(QtCore.QObject):
+    """Сигналы фонового разбора лог-файла (QRunnable не умеет их объявлять)."""
+
+    finished = QtCore.Signal(int, object)
+
+
+class LogParseTask(QtCore.QRunnable):
+    """Читает и разбирает лог-файл в общем пуле потоков, не блокируя интерфейс."""
+
+    def __init__(self, request_id: int, path: Path, signals: LogParseSignals) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._path = path
+        self._signals = signals
+
+    def run(self) -> None:
+        # finished отправляется при любой ошибке, иначе диалог так и останется в «Загрузке».
+        try:
+            entries = _read_log_entries(self._path)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to parse log file %s", self._path)
+            entries = []
+        self._signals.finished.emit(self._request_id, entries)
+
+
 class LogsDialog(QtWidgets.QDialog):
     """Показывает список лог-файлов с фильтрами, поиском и действиями."""
 
@@ -49,6 +432,22 @@ class LogsDialog(QtWidgets.QDialog):
         self._current_file: Path | None = None
         self._entries: List[LogEntry] = []
         self._filtered_entries: List[LogEntry] = []
+        # Крайние метки времени текущего файла: если диапазон дат их покрывает,
+        # фильтр по дате не нужен вовсе.
+        self._timestamp_range: Tuple[int, int] | None = None
+        # Записи, разложенные по уровням: выбор уровня не требует прохода по всему файлу.
+        self._by_level: Dict[str, List[LogEntry]] = {}
+        # Буфер поиска строится при первом поиске; последний результат переиспользуется,
+        # пока меняются только уровень и даты.
+        self._search_index: Tuple[str, array[int]] | None = None
+        self._search_hits: Tuple[str, List[LogEntry]] | None = None
+        # Номер последнего запроса разбора: результаты устаревших запросов отбрасываются.
+        self._parse_request = 0
+        self._parse_signals = LogParseSignals()
+        # Разобранные файлы по (путь, mtime_ns, размер): переключение обратно не читает диск.
+        self._parse_cache: OrderedDict[Tuple[Path, int, int], List[LogEntry]] = OrderedDict()
+        self._parse_key: Tuple[Path, int, int] | None = None
+        self._parse_signals.finished.connect(self._on_entries_parsed)
         self._state_store = QtCore.QSettings("docker-simple-manager", "LogsDialog")
 
         self._file_combo = QtWidgets.QComboBox()
@@ -56,8 +455,15 @@ class LogsDialog(QtWidgets.QDialog):
         self._search_edit = QtWidgets.QLineEdit()
         self._date_from = QtWidgets.QDateEdit()
         self._date_to = QtWidgets.QDateEdit()
-        self._table = QtWidgets.QTableWidget()
+        self._table = QtWidgets.QTableView()
+        self._model = LogTableModel(self)
         self._stats_label = QtWidgets.QLabel()
+        self._delete_button = QtWidgets.QPushButton(translate("logs.actions.delete"))
+        self._clear_button = QtWidgets.QPushButton(translate("logs.actions.clear_all"))
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filters)
 
         self.setWindowTitle(translate("logs.dialog.title"))
         self.resize(960, 580)
@@ -91,7 +497,8 @@ class LogsDialog(QtWidgets.QDialog):
         top_row.addWidget(self._level_combo)
 
         self._search_edit.setPlaceholderText(translate("logs.filter.search"))
-        self._search_edit.textChanged.connect(self._apply_filters)
+        # Ввод в поиске применяется после паузы, а не на каждое нажатие клавиши.
+        self._search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
         top_row.addWidget(self._search_edit, stretch=2)
 
         date_row = QtWidgets.QHBoxLayout()
@@ -131,14 +538,7 @@ class LogsDialog(QtWidgets.QDialog):
         self._date_to.dateChanged.connect(self._apply_filters)
 
     def _configure_table(self) -> None:
-        self._table.setColumnCount(3)
-        self._table.setHorizontalHeaderLabels(
-            [
-                translate("logs.column.timestamp"),
-                translate("logs.column.level"),
-                translate("logs.column.message"),
-            ]
-        )
+        self._table.setModel(self._model)
         header = self._table.horizontalHeader()
         header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
@@ -146,23 +546,21 @@ class LogsDialog(QtWidgets.QDialog):
         self._table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self._table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
-        self._table.itemDoubleClicked.connect(self._on_entry_double_clicked)
+        self._table.doubleClicked.connect(self._on_entry_double_clicked)
 
     def _build_actions_row(self) -> QtWidgets.QHBoxLayout:
         actions = QtWidgets.QHBoxLayout()
         export_button = QtWidgets.QPushButton(translate("logs.actions.export"))
-        delete_button = QtWidgets.QPushButton(translate("logs.actions.delete"))
-        clear_button = QtWidgets.QPushButton(translate("logs.actions.clear_all"))
         close_button = QtWidgets.QPushButton(translate("actions.close"))
 
         export_button.clicked.connect(self._export_filtered)
-        delete_button.clicked.connect(self._delete_selected_entries)
-        clear_button.clicked.connect(self._clear_current_file)
+        self._delete_button.clicked.connect(self._delete_selected_entries)
+        self._clear_button.clicked.connect(self._clear_current_file)
         close_button.clicked.connect(self.accept)
 
         actions.addWidget(export_button)
-        actions.addWidget(delete_button)
-        actions.addWidget(clear_button)
+        actions.addWidget(self._delete_button)
+        actions.addWidget(self._clear_button)
         actions.addStretch()
         actions.addWidget(close_button)
         return actions
@@ -203,56 +601,63 @@ class LogsDialog(QtWidgets.QDialog):
 
     def _on_file_changed(self, index: int) -> None:
         data = self._file_combo.itemData(index)
-        if isinstance(data, Path):
-            self._current_file = data
-            self._load_entries_from_file()
-        else:
-            self._current_file = None
-            self._entries = []
-            self._apply_filters()
+        self._current_file = data if isinstance(data, Path) else None
+        self._load_entries_from_file()
 
     def _load_entries_from_file(self) -> None:
+        self._parse_request += 1
         if not self._current_file or not self._current_file.exists():
-            self._entries = []
+            self._set_loading(False)
+            self._set_entries([])
             self._apply_filters()
             return
 
-        entries: List[LogEntry] = []
-        for line_no, raw_line in enumerate(
-            self._current_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-        ):
-            entry = self._parse_log_line(raw_line, line_no)
-            entries.append(entry)
-        self._entries = entries
+        stat = self._current_file.stat()
+        key = (self._current_file, stat.st_mtime_ns, stat.st_size)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            self._set_loading(False)
+            self._set_entries(cached)
+            self._apply_filters()
+            return
+
+        self._parse_key = key
+        self._set_loading(True)
+        task = LogParseTask(self._parse_request, self._current_file, self._parse_signals)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_entries_parsed(self, request_id: int, entries: List[LogEntry]) -> None:
+        if request_id != self._parse_request:
+            return
+        key = self._parse_key
+        # Пустой результат для непустого файла означает ошибку чтения — его не кешируем.
+        if key is not None and (entries or key[2] == 0):
+            self._parse_cache[key] = entries
+            while len(self._parse_cache) > LOG_PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        self._set_loading(False)
+        self._set_entries(entries)
         self._apply_filters()
 
-    def _parse_log_line(self, line: str, line_no: int) -> LogEntry:
-        match = None
-        for pattern in LOG_PATTERNS:
-            match = pattern.match(line)
-            if match:
-                break
-        if not match:
-            return LogEntry(line_no=line_no, raw=line, timestamp=None, level="INFO", message=line)
-
-        timestamp_text = match.group("timestamp")
-        timestamp = self._parse_timestamp(timestamp_text)
-        level = match.group("level").upper()
-        message = match.group("message").strip()
-        return LogEntry(
-            line_no=line_no, raw=line, timestamp=timestamp, level=level, message=message
-        )
+    def _set_loading(self, loading: bool) -> None:
+        # Пока файл разбирается, номера строк в таблице не соответствуют файлу.
+        self._file_combo.setEnabled(not loading)
+        self._delete_button.setEnabled(not loading)
+        self._clear_button.setEnabled(not loading)
+        if loading:
+            self._stats_label.setText(translate("logs.stats.loading"))
 
-    def _parse_timestamp(self, value: str) -> datetime | None:
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S,%f"):
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError:
-            return None
+    def _set_entries(self, entries: List[LogEntry]) -> None:
+        self._entries = entries
+        self._search_index = None
+        self._search_hits = None
+        by_level: Dict[str, List[LogEntry]] = defaultdict(list)
+        for entry in entries:
+            by_level[entry.level].append(entry)
+        self._by_level = dict(by_level)
+        epochs = [entry.ts_epoch for entry in entries if entry.ts_epoch >= 0]
+        self._timestamp_range = (min(epochs), max(epochs)) if epochs else None
 
     # ---------------------------------------------------------------- filters
     def _apply_quick_range(self, days_delta: int) -> None:
@@ -269,45 +674,55 @@ class LogsDialog(QtWidgets.QDialog):
         self._apply_filters()
 
     def _apply_filters(self) -> None:
+        self._filter_timer.stop()
         selected_level = (self._level_combo.currentData() or "ALL").upper()
-        search_text = self._search_edit.text().strip().lower()
+        search_text = self._search_edit.text().strip()
         start_date = self._date_from.date()
         end_date = self._date_to.date()
-        start_dt = datetime(start_date.year(), start_date.month(), start_date.day(), 0, 0, 0)
-        end_dt = datetime(end_date.year(), end_date.month(), end_date.day(), 23, 59, 59)
-
-        filtered: List[LogEntry] = []
-        for entry in self._entries:
-            if selected_level and selected_level != "ALL":
-                if entry.level.upper() != selected_level:
-                    continue
-            if search_text and search_text not in entry.message.lower():
-                continue
-            if entry.timestamp:
-                if entry.timestamp < start_dt or entry.timestamp > end_dt:
-                    continue
-            filtered.append(entry)
+        start_epoch = _epoch_seconds(
+            datetime(start_date.year(), start_date.month(), start_date.day(), 0, 0, 0)
+        )
+        end_epoch = _epoch_seconds(
+            datetime(end_date.year(), end_date.month(), end_date.day(), 23, 59, 59)
+        )
+
+        # Каждый активный фильтр — отдельный проход без ветвлений по неактивным.
+        level_selected = bool(selected_level) and selected_level != "ALL"
+        if search_text:
+            filtered = self._search_entries(search_text)
+            if level_selected:
+                filtered = [entry for entry in filtered if entry.level == selected_level]
+        elif level_selected:
+            filtered = self._by_level.get(selected_level, [])
+        else:
+            filtered = self._entries
+        bounds = self._timestamp_range
+        if bounds is not None and (bounds[0] < start_epoch or bounds[1] > end_epoch):
+            filtered = [
+                entry
+                for entry in filtered
+                if entry.ts_epoch < 0 or start_epoch <= entry.ts_epoch <= end_epoch
+            ]
 
         self._filtered_entries = filtered
-        self._render_table()
+        self._model.set_entries(filtered)
         self._update_stats()
 
-    def _render_table(self) -> None:
-        self._table.setRowCount(len(self._filtered_entries))
-        for row_index, entry in enumerate(self._filtered_entries):
-            items = [
-                QtWidgets.QTableWidgetItem(entry.timestamp_text),
-                QtWidgets.QTableWidgetItem(entry.level),
-                QtWidgets.QTableWidgetItem(entry.message),
-            ]
-            for col, item in enumerate(items):
-                item.setData(QtCore.Qt.ItemDataRole.UserRole, entry.line_no)
-                self._table.setItem(row_index, col, item)
-
-    def _on_entry_double_clicked(self, item: QtWidgets.QTableWidgetItem) -> None:
+    def _search_entries(self, search_text: str) -> List[LogEntry]:
+        if self._search_hits is not None and self._search_hits[0] == search_text:
+            return self._search_hits[1]
+        if self._search_index is None:
+            self._search_index = _build_search_index(self._entries)
+        haystack, starts = self._search_index
+        entries = self._entries
+        found = [entries[index] for index in _matching_entries(haystack, starts, search_text)]
+        self._search_hits = (search_text, found)
+        return found
+
+    def _on_entry_double_clicked(self, index: QtCore.QModelIndex) -> None:
         """Открывает отдельное окно с детальной информацией выбранной записи."""
 
-        row_index = item.row()  # Индекс строки, по которой выполнен двойной клик
+        row_index = index.row()  # Индекс строки, по которой выполнен двойной клик
         if row_index < 0 or row_index >= len(self._filtered_entries):
             return
         entry = self._filtered_entries[row_index]  # Выбранная запись лога
@@ -328,8 +743,9 @@ class LogsDialog(QtWidgets.QDialog):
         )
         if not target_path:
             return
-        lines = [entry.raw for entry in self._filtered_entries]
-        Path(target_path).write_text("\n".join(lines), encoding="utf-8")
+        # Строки пишутся потоком через буфер 64 КиБ, без промежуточного списка и общей строки.
+        with Path(target_path).open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            handle.writelines(entry.raw + "\n" for entry in self._filtered_entries)
 
     def _delete_selected_entries(self) -> None:
         if not self._current_file:
@@ -338,19 +754,32 @@ class LogsDialog(QtWidgets.QDialog):
         if not selected_rows:
             return
         line_numbers = {self._filtered_entries[row].line_no for row in selected_rows}
-        lines = self._current_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-        remaining = [line for idx, line in enumerate(lines) if idx not in line_numbers]
-        self._current_file.write_text(
-            "\n".join(remaining) + ("\n" if remaining else ""), encoding="utf-8"
-        )
-        self._load_entries_from_file()
+        # Файл перечитывается без разбора: приложение могло дописать строки после загрузки.
+        lines = _read_log_text(self._current_file).split("\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        with self._current_file.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            handle.writelines(
+                line + "\n" for index, line in enumerate(lines) if index not in line_numbers
+            )
+        self._forget_cached(self._current_file)
+        remaining = [entry for entry in self._entries if entry.line_no not in line_numbers]
+        for line_no, entry in enumerate(remaining):
+            entry.line_no = line_no
+        self._set_entries(remaining)
+        self._apply_filters()
 
     def _clear_current_file(self) -> None:
         if not self._current_file:
             return
         self._current_file.write_text("", encoding="utf-8")
+        self._forget_cached(self._current_file)
         self._load_entries_from_file()
 
+    def _forget_cached(self, path: Path) -> None:
+        for key in [key for key in self._parse_cache if key[0] == path]:
+            del self._parse_cache[key]
+
 
 class _LogEntryDetailsDialog(QtWidgets.QDialog):
     """Простое окно, показывающее полный текст выбранной записи лога."""
@@ -3,41 +3,67 @@
 from __future__ import annotations
 
 import datetime as dt
+import os
 import re
-from functools import partial
-from typing import Dict, List, Optional
+import threading
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from src.connections.manager import ConnectionManager
 from src.connections.models import Connection
 from src.projects.manager import ProjectManager
 from src.projects.models import Project, ProjectRunHistory
-from src.i18n.translator import translate
+from src.i18n.translator import get_language, translate
 
-SLUG_PATTERN = re.compile(r"^[a-z0-9-]+$")
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9 -]+")
+_SLUG_SEPARATORS_RE = re.compile(r"[ -]+")
+PROJECT_STATUSES = ("active", "paused", "stopped", "archived")
+
+# Поля проекта для фильтрации: имя и описание в нижнем регистре, теги в нижнем регистре, теги,
+# дата создания для сортировки и её подпись для таблицы
+_SearchEntry = Tuple[str, str, FrozenSet[str], FrozenSet[str], dt.datetime, str]
+
+
+def _parse_created(value: Optional[str]) -> Tuple[dt.datetime, str]:
+    """Разбирает дату создания проекта вида ``2024-01-01T10:00:00Z``.
+
+    Возвращает ключ сортировки и подпись для таблицы; нераспознанное значение
+    показывается как есть.
+    """
+
+    if not value:
+        return dt.datetime.min, "—"
+    try:
+        parsed = dt.datetime.fromisoformat(value)
+    except ValueError:
+        return dt.datetime.min, value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return parsed, parsed.strftime("%Y-%m-%d")
 
 
 def _normalize_identifier(value: str) -> str:
     """Удаляет недопустимые символы из идентификатора и приводит к нижнему регистру."""
 
-    slug = value.strip().lower().replace(" ", "-")
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
-    slug = re.sub(r"-+", "-", slug)
-    return slug.strip("-")
+    # Пробелы и дефисы схлопываются в один дефис уже после удаления лишних символов.
+    slug = _SLUG_INVALID_RE.sub("", value.strip().lower())
+    return _SLUG_SEPARATORS_RE.sub("-", slug).strip("-")
 
 
-def _status_label(status: str) -> str:
-    mapping = {
-        "active": translate("projects.status.active"),
-        "paused": translate("projects.status.paused"),
-        "stopped": translate("projects.status.stopped"),
-        "archived": translate("projects.status.archived"),
-    }
-    return mapping.get(status, status)
+# Подписи строятся один раз на язык интерфейса, а не при каждой строке таблицы.
+@lru_cache(maxsize=None)
+def _status_labels(language: str) -> Dict[str, str]:
+    return {status: translate(f"projects.status.{status}") for status in PROJECT_STATUSES}
 
 
-def _project_types() -> Dict[str, str]:
+@lru_cache(maxsize=None)
+def _project_type_labels(language: str) -> Dict[str, str]:
     return {
         "docker_command": translate("projects.form.type.command"),
         "dockerfile_path": translate("projects.form.type.dockerfile"),
@@ -46,6 +72,26 @@ def _project_types() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=None)
+def _form_labels(language: str) -> Dict[str, str]:
+    keys = (
+        "projects.fields.id",
+        "projects.fields.name",
+        "projects.fields.description",
+        "projects.fields.priority",
+        "projects.fields.status",
+        "projects.fields.tags",
+        "projects.fields.connection",
+        "projects.form.timeout",
+        "projects.form.max_logs",
+    )
+    return {key: translate(key) for key in keys}
+
+
+def _project_types() -> Dict[str, str]:
+    return _project_type_labels(get_language())
+
+
 class ProjectFormDialog(QtWidgets.QDialog):
     """Форма создания или редактирования проекта."""
 
@@ -61,14 +107,26 @@ class ProjectFormDialog(QtWidgets.QDialog):
         self._connection_manager = connection_manager
         self._result: Optional[Project] = None
         self._current_type = project.type if project else "docker_command"
+        self._tags: List[str] = []  # Теги в порядке добавления, содержимое модели списка
+        self._tag_set: Set[str] = set()  # Те же теги для проверки дублей за O(1)
+        self._ui_built = False
         self.setWindowTitle(translate("projects.form.title"))
         self.resize(950, 640)
 
+    # ----------------------------------------------------------------- ui
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        # Дерево виджетов формы строится при первом показе, а не в конструкторе.
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self) -> None:
+        if self._ui_built:
+            return
+        self._ui_built = True
         self._build_ui()
-        if project:
-            self._populate_form(project)
+        if self._project:
+            self._populate_form(self._project)
 
-    # ----------------------------------------------------------------- ui
     def _build_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -94,6 +152,7 @@ class ProjectFormDialog(QtWidgets.QDialog):
     def _build_general_group(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox(translate("projects.form.general"))
         form = QtWidgets.QFormLayout(group)
+        labels = _form_labels(get_language())
 
         self._id_edit = QtWidgets.QLineEdit()
         self._id_edit.setPlaceholderText("my-project")
@@ -102,25 +161,25 @@ class ProjectFormDialog(QtWidgets.QDialog):
         id_layout = QtWidgets.QVBoxLayout()
         id_layout.addWidget(self._id_edit)
         id_layout.addWidget(slug_hint)
-        form.addRow(translate("projects.fields.id"), id_layout)
+        form.addRow(labels["projects.fields.id"], id_layout)
 
         self._name_edit = QtWidgets.QLineEdit()
-        form.addRow(translate("projects.fields.name"), self._name_edit)
+        form.addRow(labels["projects.fields.name"], self._name_edit)
 
         self._description_edit = QtWidgets.QPlainTextEdit()
-        self._description_edit.setPlaceholderText(translate("projects.fields.description"))
+        self._description_edit.setPlaceholderText(labels["projects.fields.description"])
         self._description_edit.setFixedHeight(80)
-        form.addRow(translate("projects.fields.description"), self._description_edit)
+        form.addRow(labels["projects.fields.description"], self._description_edit)
 
         self._priority_spin = QtWidgets.QSpinBox()
         self._priority_spin.setRange(1, 5)
         self._priority_spin.setValue(3)
-        form.addRow(translate("projects.fields.priority"), self._priority_spin)
+        form.addRow(labels["projects.fields.priority"], self._priority_spin)
 
         self._status_combo = QtWidgets.QComboBox()
-        for status in ("active", "paused", "stopped", "archived"):
-            self._status_combo.addItem(_status_label(status), status)
-        form.addRow(translate("projects.fields.status"), self._status_combo)
+        for status, label in _status_labels(get_language()).items():
+            self._status_combo.addItem(label, status)
+        form.addRow(labels["projects.fields.status"], self._status_combo)
 
         tags_layout = QtWidgets.QVBoxLayout()
         top_row = QtWidgets.QHBoxLayout()
@@ -141,12 +200,15 @@ class ProjectFormDialog(QtWidgets.QDialog):
         hint = QtWidgets.QLabel(translate("projects.form.tags_hint"))
         hint.setWordWrap(True)
         tags_layout.addWidget(hint)
-        self._tags_list = QtWidgets.QListWidget()
-        self._tags_list.setSelectionMode(
+        self._tags_model = QtCore.QStringListModel(self)
+        self._tags_view = QtWidgets.QListView()
+        self._tags_view.setModel(self._tags_model)
+        self._tags_view.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._tags_view.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection
         )
-        tags_layout.addWidget(self._tags_list)
-        form.addRow(translate("projects.fields.tags"), tags_layout)
+        tags_layout.addWidget(self._tags_view)
+        form.addRow(labels["projects.fields.tags"], tags_layout)
 
         return group
 
@@ -161,7 +223,8 @@ class ProjectFormDialog(QtWidgets.QDialog):
             button = QtWidgets.QRadioButton(label)
             button.setChecked(project_type == self._current_type)
             self._type_buttons.addButton(button)
-            button.toggled.connect(partial(self._on_type_changed, project_type))
+            button.setProperty("project_type", project_type)
+            button.toggled.connect(self._on_type_toggled)
             types_row.addWidget(button)
         layout.addLayout(types_row)
 
@@ -193,14 +256,15 @@ class ProjectFormDialog(QtWidgets.QDialog):
     def _build_run_group(self) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox(translate("projects.form.run_settings"))
         form = QtWidgets.QFormLayout(group)
+        labels = _form_labels(get_language())
 
         self._connection_combo = QtWidgets.QComboBox()
         for connection in self._connection_manager.list_connections():
             self._connection_combo.addItem(connection.name, connection.identifier)
-        form.addRow(translate("projects.fields.connection"), self._connection_combo)
+        form.addRow(labels["projects.fields.connection"], self._connection_combo)
 
         self._detached_checkbox = QtWidgets.QCheckBox(translate("projects.form.detached"))
-        form.addRow("", self._detached_checkbox)
+        form.addRow(None, self._detached_checkbox)
 
         timeout_row = QtWidgets.QHBoxLayout()
         self._timeout_spin = QtWidgets.QSpinBox()
@@ -211,16 +275,16 @@ class ProjectFormDialog(QtWidgets.QDialog):
             QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
         )
         timeout_row.addWidget(timeout_hint)
-        form.addRow(translate("projects.form.timeout"), timeout_row)
+        form.addRow(labels["projects.form.timeout"], timeout_row)
 
         self._save_logs_checkbox = QtWidgets.QCheckBox(translate("projects.form.save_logs"))
         self._save_logs_checkbox.setChecked(True)
-        form.addRow("", self._save_logs_checkbox)
+        form.addRow(None, self._save_logs_checkbox)
 
         self._max_logs_spin = QtWidgets.QSpinBox()
         self._max_logs_spin.setRange(100, 100000)
         self._max_logs_spin.setValue(1000)
-        form.addRow(translate("projects.form.max_logs"), self._max_logs_spin)
+        form.addRow(labels["projects.form.max_logs"], self._max_logs_spin)
         return group
 
     # -------------------------------------------------------------- handlers
@@ -228,26 +292,34 @@ class ProjectFormDialog(QtWidgets.QDialog):
         raw = self._tags_input.text().strip()
         if not raw:
             return
-        for tag in [part.strip() for part in raw.split(",") if part.strip()]:
-            if not self._tag_exists(tag):
-                self._tags_list.addItem(tag)
+        self._add_tags(part.strip() for part in raw.split(","))
         self._tags_input.clear()
 
-    def _remove_selected_tag(self) -> None:
-        for item in self._tags_list.selectedItems():
-            row = self._tags_list.row(item)
-            self._tags_list.takeItem(row)
+    def _add_tags(self, tags: Iterable[str]) -> None:
+        added = False
+        for tag in tags:
+            if tag and tag not in self._tag_set:
+                self._tag_set.add(tag)
+                self._tags.append(tag)
+                added = True
+        if added:
+            # Модель сбрасывается один раз на всю пачку тегов
+            self._tags_model.setStringList(self._tags)
 
-    def _tag_exists(self, tag: str) -> bool:
-        for index in range(self._tags_list.count()):
-            if self._tags_list.item(index).text() == tag:
-                return True
-        return False
+    def _remove_selected_tag(self) -> None:
+        rows = {index.row() for index in self._tags_view.selectionModel().selectedRows()}
+        if not rows:
+            return
+        for row in rows:
+            self._tag_set.discard(self._tags[row])
+        self._tags = [tag for row, tag in enumerate(self._tags) if row not in rows]
+        self._tags_model.setStringList(self._tags)
 
-    def _on_type_changed(self, project_type: str, checked: bool) -> None:
+    def _on_type_toggled(self, checked: bool) -> None:
+        # Тип проекта хранится в свойстве кнопки, поэтому один слот обслуживает все кнопки
         if not checked:
             return
-        self._current_type = project_type
+        self._current_type = self.sender().property("project_type")
         self._sync_command_inputs()
 
     def _sync_command_inputs(self) -> None:
@@ -285,9 +357,7 @@ class ProjectFormDialog(QtWidgets.QDialog):
         status_index = self._status_combo.findData(project.status)
         if status_index >= 0:
             self._status_combo.setCurrentIndex(status_index)
-        for tag in project.tags:
-            if not self._tag_exists(tag):
-                self._tags_list.addItem(tag)
+        self._add_tags(project.tags)
         if project.type == "docker_command":
             self._command_edit.setPlainText(project.command_or_path)
         else:
@@ -306,34 +376,25 @@ class ProjectFormDialog(QtWidgets.QDialog):
         self._id_edit.setText(identifier)
         name = self._name_edit.text().strip()
         connection_id = self._connection_combo.currentData()
-        if not identifier or not name or not connection_id:
-            QtWidgets.QMessageBox.warning(
-                self,
-                translate("messages.validation_error_title"),
-                translate("messages.validation_project"),
-            )
-            return
-        if not identifier or not SLUG_PATTERN.match(identifier):
-            QtWidgets.QMessageBox.warning(
-                self,
-                translate("messages.validation_error_title"),
-                translate("projects.form.slug_hint"),
-            )
-            return
-
-        command_value = self._command_edit.toPlainText().strip()
-        if self._current_type != "docker_command":
+        if self._current_type == "docker_command":
+            command_value = self._command_edit.toPlainText().strip()
+        else:
             command_value = self._path_edit.text().strip()
+        # Нормализованный идентификатор уже состоит только из [a-z0-9-], отдельная проверка
+        # формата не нужна; все ошибки показываем одним сообщением.
+        errors = []
+        if not identifier or not name or not connection_id:
+            errors.append(translate("messages.validation_project"))
         if not command_value:
+            errors.append(translate("projects.fields.command"))
+        if errors:
             QtWidgets.QMessageBox.warning(
-                self,
-                translate("messages.validation_error_title"),
-                translate("projects.fields.command"),
+                self, translate("messages.validation_error_title"), "\n".join(errors)
             )
             return
 
         self._add_tag_from_input()
-        tags = [self._tags_list.item(i).text() for i in range(self._tags_list.count())]
+        tags = list(self._tags)
         base_kwargs = {
             "identifier": identifier,
             "name": name,
@@ -365,6 +426,95 @@ class ProjectFormDialog(QtWidgets.QDialog):
         return self._result
 
 
+class ProjectActionsDelegate(QtWidgets.QStyledItemDelegate):
+    """Рисует кнопки действий проекта в ячейке таблицы и обрабатывает клики по ним."""
+
+    actionTriggered = QtCore.Signal(str, str)  # действие, идентификатор проекта
+
+    ACTIONS = (
+        ("run", "▶", "projects.actions.run"),
+        ("edit", "✎", "actions.edit"),
+        ("delete", "🗑", "actions.delete"),
+    )
+    CELL_WIDTH = 32
+    _MOUSE_EVENTS = (
+        QtCore.QEvent.Type.MouseButtonPress,
+        QtCore.QEvent.Type.MouseButtonRelease,
+        QtCore.QEvent.Type.MouseButtonDblClick,
+    )
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        super().paint(painter, option, index)
+        painter.save()
+        if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+            painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.HighlightedText))
+        for position, (_action, glyph, _tooltip) in enumerate(self.ACTIONS):
+            painter.drawText(
+                self._cell_rect(option.rect, position), QtCore.Qt.AlignmentFlag.AlignCenter, glyph
+            )
+        painter.restore()
+
+    def sizeHint(
+        self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex
+    ) -> QtCore.QSize:
+        size = super().sizeHint(option, index)
+        return QtCore.QSize(self.CELL_WIDTH * len(self.ACTIONS), size.height())
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        if event.type() not in self._MOUSE_EVENTS:
+            return super().editorEvent(event, model, option, index)
+        position = self._action_at(option.rect, event.position().toPoint())
+        if position is None:
+            return super().editorEvent(event, model, option, index)
+        # Нажатие и двойной клик поглощаем, чтобы они не меняли выделение и не открывали
+        # редактирование; действие выполняется по отпусканию кнопки, как у QToolButton.
+        if (
+            event.type() == QtCore.QEvent.Type.MouseButtonRelease
+            and event.button() == QtCore.Qt.MouseButton.LeftButton
+        ):
+            identifier = index.data(QtCore.Qt.ItemDataRole.UserRole)
+            if identifier:
+                self.actionTriggered.emit(self.ACTIONS[position][0], identifier)
+        return True
+
+    def helpEvent(
+        self,
+        event: QtGui.QHelpEvent,
+        view: QtWidgets.QAbstractItemView,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        if event.type() == QtCore.QEvent.Type.ToolTip:
+            position = self._action_at(option.rect, event.pos())
+            if position is not None:
+                tooltip = translate(self.ACTIONS[position][2])
+                QtWidgets.QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+    def _cell_rect(self, rect: QtCore.QRect, position: int) -> QtCore.QRect:
+        return QtCore.QRect(
+            rect.left() + position * self.CELL_WIDTH, rect.top(), self.CELL_WIDTH, rect.height()
+        )
+
+    def _action_at(self, rect: QtCore.QRect, point: QtCore.QPoint) -> Optional[int]:
+        if not rect.contains(point):
+            return None
+        position = (point.x() - rect.left()) // self.CELL_WIDTH
+        return position if position < len(self.ACTIONS) else None
+
+
 class ProjectsDialog(QtWidgets.QDialog):
     """Диалог управления перечнем проектов."""
 
@@ -379,11 +529,23 @@ class ProjectsDialog(QtWidgets.QDialog):
         self._manager = project_manager
         self._connection_manager = connection_manager
         self._projects: List[Project] = []
-        self._filtered: List[Project] = []
-        self._state_store = QtCore.QSettings("docker-simple-manager", "ProjectsDialog")
+        self._rows: List[Project] = []  # Проекты в порядке строк таблицы
+        self._projects_by_id: Dict[str, Project] = {}
+        self._index: Dict[str, _SearchEntry] = {}
+        self._connections: Dict[str, Connection] = {}
+        self._tag_filter_initialized = False
+        self._filter_tags: List[str] = []
+        self._state_store = _open_state_store()
+        self._state_saved = False
         self.setWindowTitle(translate("projects.dialog.title"))
         self.resize(1100, 620)
-        self._run_workers: List[ProjectRunThread] = []
+        self._run_dispatcher = ProjectRunDispatcher(project_manager, self)
+        self._run_dispatcher.result.connect(self._on_project_run_success)
+        self._run_dispatcher.error.connect(self._on_project_run_error)
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filters)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addLayout(self._build_toolbar())
@@ -409,7 +571,7 @@ class ProjectsDialog(QtWidgets.QDialog):
         layout.addWidget(QtWidgets.QLabel(translate("projects.filter.search")))
         self._search_edit = QtWidgets.QLineEdit()
         self._search_edit.setPlaceholderText(translate("projects.filter.placeholder"))
-        self._search_edit.textChanged.connect(self._apply_filters)
+        self._search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
         layout.addWidget(self._search_edit)
         return layout
 
@@ -423,8 +585,8 @@ class ProjectsDialog(QtWidgets.QDialog):
         layout.addWidget(QtWidgets.QLabel(translate("projects.filter.status")))
         self._status_filter = QtWidgets.QComboBox()
         self._status_filter.addItem(translate("projects.filter.status_all"), None)
-        for status in ("active", "paused", "stopped", "archived"):
-            self._status_filter.addItem(_status_label(status), status)
+        for status, label in _status_labels(get_language()).items():
+            self._status_filter.addItem(label, status)
         self._status_filter.currentIndexChanged.connect(self._apply_filters)
         layout.addWidget(self._status_filter)
 
@@ -433,7 +595,7 @@ class ProjectsDialog(QtWidgets.QDialog):
         self._sort_combo.addItem(translate("projects.filter.sort_name"), "name")
         self._sort_combo.addItem(translate("projects.filter.sort_recent"), "recent")
         self._sort_combo.addItem(translate("projects.filter.sort_priority"), "priority")
-        self._sort_combo.currentIndexChanged.connect(self._apply_filters)
+        self._sort_combo.currentIndexChanged.connect(self._apply_sort)
         layout.addWidget(self._sort_combo)
         layout.addStretch()
         return layout
@@ -459,127 +621,173 @@ class ProjectsDialog(QtWidgets.QDialog):
         self._table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.doubleClicked.connect(self._edit_selected_project)
+        # Один делегат на колонку действий вместо отдельного виджета с кнопками в каждой строке
+        self._actions_delegate = ProjectActionsDelegate(self._table)
+        self._actions_delegate.actionTriggered.connect(self._on_project_action)
+        self._table.setItemDelegateForColumn(5, self._actions_delegate)
+        self._action_handlers: Dict[str, Callable[[Optional[str]], None]] = {
+            "run": self._run_project,
+            "edit": self._edit_project,
+            "delete": self._delete_project,
+        }
         return self._table
 
     # --------------------------------------------------------------- data
     def _reload_projects(self) -> None:
         self._projects = self._manager.list_projects()
+        self._projects_by_id = {project.identifier: project for project in self._projects}
+        self._index = {}
+        for project in self._projects:
+            created, created_label = _parse_created(project.created_at)
+            self._index[project.identifier] = (
+                project.name.lower(),
+                project.description.lower(),
+                frozenset(tag.lower() for tag in project.tags),
+                frozenset(project.tags),
+                created,
+                created_label,
+            )
+        self._connections = {
+            connection.identifier: connection
+            for connection in self._connection_manager.list_connections()
+        }
         self._rebuild_tag_filter()
-        self._apply_filters()
+        self._apply_sort()
 
     def _rebuild_tag_filter(self) -> None:
-        tags = sorted({tag for project in self._projects for tag in project.tags})
-        current = self._tag_filter.currentData() if hasattr(self, "_tag_filter") else None
-        self._tag_filter.blockSignals(True)
-        self._tag_filter.clear()
-        self._tag_filter.addItem(translate("projects.filter.tags_all"), None)
-        for tag in tags:
-            self._tag_filter.addItem(tag, tag)
-        if current is not None:
-            index = self._tag_filter.findData(current)
-            if index >= 0:
-                self._tag_filter.setCurrentIndex(index)
-        self._tag_filter.blockSignals(False)
+        unique_tags: Set[str] = set()
+        for project in self._projects:
+            unique_tags.update(project.tags)
+        tags = sorted(unique_tags)
+        if self._tag_filter_initialized and tags == self._filter_tags:
+            return  # Набор тегов не изменился — выбор в фильтре остаётся как есть
+        current = self._selected_tag() if self._tag_filter_initialized else None
+        combo = self._tag_filter
+        view = combo.view()
+        combo.blockSignals(True)
+        view.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItem(translate("projects.filter.tags_all"))
+            combo.addItems(tags)
+            if current is not None:
+                # Теги отсортированы, поэтому позицию выбранного ищем бинарным поиском
+                position = bisect_left(tags, current)
+                if position < len(tags) and tags[position] == current:
+                    combo.setCurrentIndex(position + 1)
+        finally:
+            view.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+        self._filter_tags = tags
+        self._tag_filter_initialized = True
+
+    def _selected_tag(self) -> Optional[str]:
+        # Нулевой элемент — «все теги», остальные подписаны самим тегом
+        if self._tag_filter.currentIndex() <= 0:
+            return None
+        return self._tag_filter.currentText()
+
+    def _apply_sort(self) -> None:
+        # Таблица перестраивается только при смене порядка; фильтры лишь скрывают строки
+        sort_mode = self._sort_combo.currentData()
+        if sort_mode in ("name", "recent"):
+            # Ключи (имя, дата создания) уже посчитаны в индексе при загрузке
+            position = 0 if sort_mode == "name" else 4
+            index = self._index
+            keyed = [(index[project.identifier][position], project) for project in self._projects]
+            keyed.sort(key=itemgetter(0), reverse=sort_mode == "recent")
+            rows = list(map(itemgetter(1), keyed))
+        else:
+            rows = list(self._projects)
+            if sort_mode == "priority":
+                rows.sort(key=attrgetter("priority"), reverse=True)
+        self._rows = rows
+        self._populate_table()
+        self._apply_filters()
 
     def _apply_filters(self) -> None:
+        self._filter_timer.stop()
         search = self._search_edit.text().strip().lower()
-        tag = self._tag_filter.currentData()
+        tag = self._selected_tag()
         status = self._status_filter.currentData()
-        sort_mode = self._sort_combo.currentData()
 
-        filtered = []
-        for project in self._projects:
-            if tag and tag not in project.tags:
-                continue
-            if status and project.status != status:
-                continue
-            if (
-                search
-                and search not in project.name.lower()
-                and search not in project.description.lower()
-            ):
-                tag_match = any(search in tag.lower() for tag in project.tags)
-                if not tag_match:
-                    continue
-            filtered.append(project)
-
-        if sort_mode == "name":
-            filtered.sort(key=lambda proj: proj.name.lower())
-        elif sort_mode == "recent":
-            filtered.sort(key=lambda proj: self._parse_timestamp(proj.created_at), reverse=True)
-        elif sort_mode == "priority":
-            filtered.sort(key=lambda proj: proj.priority, reverse=True)
-
-        self._filtered = filtered
-        self._populate_table()
+        index = self._index
+        table = self._table
+        table.setUpdatesEnabled(False)
+        try:
+            for row, project in enumerate(self._rows):
+                name, description, tags_lower, tags, _created, _label = index[project.identifier]
+                matches = (
+                    (not tag or tag in tags)
+                    and (not status or project.status == status)
+                    and (
+                        not search
+                        or search in name
+                        or search in description
+                        or any(search in value for value in tags_lower)
+                    )
+                )
+                table.setRowHidden(row, not matches)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def _populate_table(self) -> None:
-        self._table.setRowCount(len(self._filtered))
-        for row, project in enumerate(self._filtered):
-            self._set_text_item(row, 0, project.name, project.identifier)
-            self._set_text_item(row, 1, project.description)
-            connection_name = self._resolve_connection_name(project.connection_id)
-            self._set_text_item(row, 2, connection_name)
-            self._set_text_item(row, 3, _status_label(project.status))
-            self._set_text_item(row, 4, self._format_created(project.created_at))
-            self._table.setCellWidget(row, 5, self._make_actions_widget(project))
-
-    def _set_text_item(
-        self, row: int, column: int, text: str, identifier: Optional[str] = None
-    ) -> None:
+        status_labels = _status_labels(get_language())
+        index = self._index
+        rows = [
+            (
+                self._make_text_item(project.name, project.identifier),
+                self._make_text_item(project.description),
+                self._make_text_item(self._resolve_connection_name(project.connection_id)),
+                self._make_text_item(status_labels.get(project.status, project.status)),
+                self._make_text_item(index[project.identifier][5]),
+                self._make_actions_item(project.identifier),
+            )
+            for project in self._rows
+        ]
+        table = self._table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(rows))
+            for row, items in enumerate(rows):
+                for column, item in enumerate(items):
+                    table.setItem(row, column, item)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _make_text_item(text: str, identifier: Optional[str] = None) -> QtWidgets.QTableWidgetItem:
         item = QtWidgets.QTableWidgetItem(text or "—")
         if identifier is not None:
             item.setData(QtCore.Qt.ItemDataRole.UserRole, identifier)
-        self._table.setItem(row, column, item)
-
-    def _make_actions_widget(self, project: Project) -> QtWidgets.QWidget:
-        widget = QtWidgets.QWidget()
-        layout = QtWidgets.QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        actions = [
-            ("▶", translate("projects.actions.run"), self._run_project),
-            ("✎", translate("actions.edit"), self._edit_project),
-            ("🗑", translate("actions.delete"), self._delete_project),
-        ]
-        for icon, tooltip, handler in actions:
-            button = QtWidgets.QToolButton()
-            button.setText(icon)
-            button.setToolTip(tooltip)
-            button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-            button.clicked.connect(partial(handler, project.identifier))
-            layout.addWidget(button)
-        layout.addStretch()
-        return widget
+        return item
+
+    @staticmethod
+    def _make_actions_item(identifier: str) -> QtWidgets.QTableWidgetItem:
+        item = QtWidgets.QTableWidgetItem()
+        item.setData(QtCore.Qt.ItemDataRole.UserRole, identifier)
+        return item
+
+    def _on_project_action(self, action: str, identifier: str) -> None:
+        handler = self._action_handlers.get(action)
+        if handler is not None:
+            handler(identifier)
 
     # ----------------------------------------------------------- utilities
     def _resolve_connection_name(self, identifier: str) -> str:
-        try:
-            return self._connection_manager.get_connection(identifier).name
-        except KeyError:
-            return identifier
-
-    def _format_created(self, value: Optional[str]) -> str:
-        if not value:
-            return "—"
-        try:
-            date = self._parse_timestamp(value)
-            return date.strftime("%Y-%m-%d")
-        except ValueError:
-            return value
-
-    def _parse_timestamp(self, value: Optional[str]) -> dt.datetime:
-        if not value:
-            return dt.datetime.min
-        try:
-            return dt.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-        except ValueError:
-            return dt.datetime.min
+        connection = self._connections.get(identifier)
+        return connection.name if connection is not None else identifier
 
     def _current_project(self) -> Optional[Project]:
         row = self._table.currentRow()
-        if row < 0 or row >= len(self._filtered):
+        if row < 0 or row >= len(self._rows) or self._table.isRowHidden(row):
             return None
-        return self._filtered[row]
+        return self._rows[row]
 
     # --------------------------------------------------------------- actions
     def _add_project(self) -> None:
@@ -629,32 +837,20 @@ class ProjectsDialog(QtWidgets.QDialog):
         if not project:
             self._show_info(translate("projects.messages.no_project_selected"))
             return
-        try:
-            connection = self._connection_manager.get_connection(project.connection_id)
-        except KeyError:
+        connection = self._connections.get(project.connection_id)
+        if connection is None:
             self._show_error(translate("projects.messages.no_connection"))
             return
         confirm = translate("projects.confirm.run").format(name=project.name)
         reply = QtWidgets.QMessageBox.question(self, translate("projects.actions.run"), confirm)
         if reply != QtWidgets.QMessageBox.StandardButton.Yes:
             return
-        worker = ProjectRunThread(self._manager, project.identifier, connection)
-        worker.result.connect(self._on_project_run_success)
-        worker.error.connect(self._on_project_run_error)
-        worker.finished.connect(worker.deleteLater)
-        worker.finished.connect(lambda w=worker: self._cleanup_run_worker(w))
-        self._run_workers.append(worker)
-        worker.start()
+        self._run_dispatcher.submit(project.identifier, connection)
 
     def _find_project(self, identifier: Optional[str]) -> Optional[Project]:
-        if not identifier:
-            return None
-        for project in self._projects:
-            if project.identifier == identifier:
-                return project
-        return None
+        return self._projects_by_id.get(identifier) if identifier else None
 
-    def _on_project_run_success(self, entry: ProjectRunHistory) -> None:
+    def _on_project_run_success(self, _run_id: int, entry: ProjectRunHistory) -> None:
         if entry.status == "running":
             self._show_info(translate("projects.messages.run_started_detached"))
         elif entry.status == "success":
@@ -664,19 +860,12 @@ class ProjectsDialog(QtWidgets.QDialog):
             self._show_error(translate("projects.messages.run_failed").format(error=error_text))
         self._reload_projects()
 
-    def _on_project_run_error(self, payload: Dict[str, str]) -> None:
-        error_type = payload.get("type")
-        message = payload.get("message", "")
-        if error_type == "file":
-            self._show_error(translate("projects.messages.file_not_found").format(path=message))
+    def _on_project_run_error(self, _run_id: int, error: ProjectRunError) -> None:
+        if error.kind == "file":
+            template = translate("projects.messages.file_not_found")
+            self._show_error(template.format(path=error.message))
         else:
-            self._show_error(message)
-
-    def _cleanup_run_worker(self, worker: "ProjectRunThread") -> None:
-        try:
-            self._run_workers.remove(worker)
-        except ValueError:
-            pass
+            self._show_error(error.message)
 
     # ------------------------------------------------------------- messaging
     def _show_info(self, text: str) -> None:
@@ -687,51 +876,207 @@ class ProjectsDialog(QtWidgets.QDialog):
 
     def accept(self) -> None:
         self._save_state()
+        self._run_dispatcher.cancel()
         super().accept()
 
     def reject(self) -> None:  # pragma: no cover - всегда считаем работу успешной
         self.accept()
 
     def _save_state(self) -> None:
-        self._state_store.setValue("geometry", self.saveGeometry())
-        self._state_store.setValue("header_state", self._table.horizontalHeader().saveState())
+        # Состояние пишется на диск один раз при закрытии, повторные accept/reject его не трогают.
+        # Снимок берётся в UI-потоке, а запись с sync() уходит в пул потоков.
+        if self._state_saved:
+            return
+        self._state_saved = True
+        values = {
+            "geometry": self.saveGeometry(),
+            "header_state": self._table.horizontalHeader().saveState(),
+        }
+        QtCore.QThreadPool.globalInstance().start(_StateWriteTask(values))
 
     def _restore_state(self) -> None:
-        geometry = self._state_store.value("geometry")
+        geometry = _as_byte_array(self._state_store.value("geometry"))
         if geometry is not None:
-            if isinstance(geometry, QtCore.QByteArray):
-                self.restoreGeometry(geometry)
-            else:
-                self.restoreGeometry(QtCore.QByteArray(geometry))
-        header_state = self._state_store.value("header_state")
+            self.restoreGeometry(geometry)
+        header_state = _as_byte_array(self._state_store.value("header_state"))
         if header_state is not None:
-            if not isinstance(header_state, QtCore.QByteArray):
-                header_state = QtCore.QByteArray(header_state)
             self._table.horizontalHeader().restoreState(header_state)
 
 
-class ProjectRunThread(QtCore.QThread):
-    """Фоновый запуск проекта, чтобы не блокировать UI."""
+def _open_state_store() -> QtCore.QSettings:
+    return QtCore.QSettings("docker-simple-manager", "ProjectsDialog")
 
-    result = QtCore.Signal(object)
-    error = QtCore.Signal(dict)
 
-    def __init__(
-        self,
-        manager: ProjectManager,
-        project_id: str,
-        connection: Connection,
-    ) -> None:
+def _as_byte_array(value: object) -> Optional[QtCore.QByteArray]:
+    """Приводит значение из QSettings к QByteArray, не копируя уже готовый массив."""
+
+    if value is None or isinstance(value, QtCore.QByteArray):
+        return value
+    return QtCore.QByteArray(value)
+
+
+class _StateWriteTask(QtCore.QRunnable):
+    """Сохраняет состояние диалога проектов на диск в пуле потоков."""
+
+    def __init__(self, values: Dict[str, QtCore.QByteArray]) -> None:
         super().__init__()
+        self._values = values
+
+    def run(self) -> None:
+        # QSettings не потокобезопасен, поэтому в рабочем потоке открывается свой экземпляр
+        store = _open_state_store()
+        for key, value in self._values.items():
+            store.setValue(key, value)
+        store.sync()
+
+
+_RUN_POOL: Optional[QtCore.QThreadPool] = None
+
+
+def _project_run_pool() -> QtCore.QThreadPool:
+    """Отдельный пул для запусков: долгие команды не должны занимать общий пул потоков."""
+
+    global _RUN_POOL
+    if _RUN_POOL is None:
+        _RUN_POOL = QtCore.QThreadPool(QtCore.QCoreApplication.instance())
+        # Потоки почти всё время ждут дочерний процесс, поэтому пул не меньше четырёх потоков
+        _RUN_POOL.setMaxThreadCount(max(os.cpu_count() or 1, 4))
+    return _RUN_POOL
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectRunError:
+    """Ошибка запуска проекта: вид (``file`` или ``generic``) и текст."""
+
+    kind: str
+    message: str
+
+
+_ERROR_SIGNAL = QtCore.SIGNAL("error(int,PyObject)")
+
+
+@dataclass(slots=True)
+class _RunSubmission:
+    """Заявка на запуск проекта в очереди диспетчера."""
+
+    run_id: int
+    project_id: str
+    connection: Connection
+
+
+class ProjectRunDispatcher(QtCore.QObject):
+    """Очередь запусков проектов поверх пула потоков.
+
+    Заявки складываются в очередь отправки и разбираются рабочими задачами пула (их не больше
+    размера пула, сколько бы проектов ни запускалось). Результаты копятся в очереди
+    завершений и передаются в UI пачкой: один межпоточный сигнал на пачку, а не на запуск.
+    Повторный запуск проекта, который ещё ждёт в очереди, не создаёт новую заявку.
+    После cancel() ожидающие заявки отбрасываются, а выполняющиеся команды завершаются.
+    """
+
+    result = QtCore.Signal(int, object)  # номер заявки, ProjectRunHistory
+    error = QtCore.Signal(int, object)  # номер заявки, ProjectRunError
+    _completions_ready = QtCore.Signal()
+
+    def __init__(self, manager: ProjectManager, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
         self._manager = manager
-        self._project_id = project_id
-        self._connection = connection
+        self._lock = threading.Lock()
+        self._submissions: Deque[_RunSubmission] = deque()
+        self._pending: Dict[str, _RunSubmission] = {}  # Ещё не начатые заявки по проекту
+        self._completions: Deque[Tuple[int, bool, object]] = deque()
+        self._next_id = 0
+        self._workers = 0
+        self._cancel = threading.Event()
+        # Завершения всегда разбираются в потоке диспетчера (UI) через его цикл событий
+        self._completions_ready.connect(
+            self._drain_completions, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+
+    def submit(self, project_id: str, connection: Connection) -> int:
+        """Ставит запуск в очередь и возвращает номер заявки.
+
+        Если проект уже ждёт в очереди, заявка обновляет соединение и сохраняет свой номер.
+        """
+
+        pool = _project_run_pool()
+        with self._lock:
+            queued = self._pending.get(project_id)
+            if queued is not None:
+                queued.connection = connection
+                return queued.run_id
+            self._next_id += 1
+            submission = _RunSubmission(self._next_id, project_id, connection)
+            self._submissions.append(submission)
+            self._pending[project_id] = submission
+            start_worker = self._workers < pool.maxThreadCount()
+            if start_worker:
+                self._workers += 1
+        if start_worker:
+            pool.start(_ProjectRunWorker(self))
+        return submission.run_id
+
+    def drain_submissions(self) -> None:
+        """Выполняет заявки, пока очередь не опустеет (вызывается в потоке пула)."""
+
+        while True:
+            with self._lock:
+                if not self._submissions or self._cancel.is_set():
+                    self._workers -= 1
+                    return
+                submission = self._submissions.popleft()
+                del self._pending[submission.project_id]
+            run_id = submission.run_id
+            completion: Tuple[int, bool, object]
+            try:
+                entry = self._manager.run_project(
+                    submission.project_id, submission.connection, self._cancel
+                )
+                completion = (run_id, True, entry)
+            except Exception as exc:
+                completion = (run_id, False, self._run_error(exc))
+            with self._lock:
+                if self._cancel.is_set():
+                    continue  # Результат отменённого запуска уже никто не ждёт
+                notify = not self._completions
+                self._completions.append(completion)
+            if notify:
+                self._completions_ready.emit()
+
+    def cancel(self) -> None:
+        """Отменяет ожидающие заявки и прерывает выполняющиеся запуски."""
+
+        with self._lock:
+            self._cancel.set()
+            self._submissions.clear()
+            self._pending.clear()
+            self._completions.clear()
+
+    def _run_error(self, exc: Exception) -> ProjectRunError:
+        kind = "file" if isinstance(exc, FileNotFoundError) else "generic"
+        # Текст ошибки может содержать весь вывод команды: строим его, только если есть кому
+        # его показать
+        message = str(exc) if self.receivers(_ERROR_SIGNAL) else ""
+        return ProjectRunError(kind, message)
+
+    @QtCore.Slot()
+    def _drain_completions(self) -> None:
+        with self._lock:
+            completions = list(self._completions)
+            self._completions.clear()
+        for run_id, succeeded, payload in completions:
+            if succeeded:
+                self.result.emit(run_id, payload)
+            else:
+                self.error.emit(run_id, payload)
+
+
+class _ProjectRunWorker(QtCore.QRunnable):
+    """Рабочая задача пула, разбирающая очередь заявок диспетчера."""
+
+    def __init__(self, dispatcher: ProjectRunDispatcher) -> None:
+        super().__init__()
+        self._dispatcher = dispatcher
 
     def run(self) -> None:
-        try:
-            entry = self._manager.run_project(self._project_id, self._connection)
-            self.result.emit(entry)
-        except FileNotFoundError as exc:
-            self.error.emit({"type": "file", "message": str(exc)})
-        except Exception as exc:
-            self.error.emit({"type": "generic", "message": str(exc)})
+        self._dispatcher.drain_submissions()
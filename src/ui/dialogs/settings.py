@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from src.connections.manager import ConnectionManager
-from src.i18n.translator import translate
+from src.i18n.translator import get_language, translate
 from src.settings.exceptions import SettingsValidationError
+from src.settings.groups import SettingsGroup
 from src.settings.registry import SettingsRegistry
 from src.ui.dialogs.help import HelpDialog
 
@@ -37,6 +38,8 @@ VARIANT_LABEL_KEYS = {
     "dark": "settings.appearance.dark",
 }
 
+DIALOG_GROUPS = ("metrics", "terminal", "logging", "theme", "hotkeys")
+
 HOTKEY_ACTIONS: List[tuple[str, str]] = [
     ("open_connections_manager", "settings.hotkeys.actions.open_connections_manager"),
     ("test_connection", "settings.hotkeys.actions.test_connection"),
@@ -57,6 +60,33 @@ HOTKEY_ACTIONS: List[tuple[str, str]] = [
 ]
 
 
+# Диалог строит десятки подписей при каждом открытии; язык входит в ключ кэша,
+# поэтому после смены языка старые записи просто не используются.
+@lru_cache(maxsize=4096)
+def _cached_translation(key: str, language: str) -> str:
+    return translate(key)
+
+
+def _tr(key: str) -> str:
+    return _cached_translation(key, get_language())
+
+
+# Таблицы подписей для строк вкладок строятся один раз на язык интерфейса.
+@lru_cache(maxsize=None)
+def _hotkey_action_labels(language: str) -> Dict[str, str]:
+    return {key: translate(label_key) for key, label_key in HOTKEY_ACTIONS}
+
+
+@lru_cache(maxsize=None)
+def _theme_color_labels(language: str) -> Dict[str, str]:
+    return {key: translate(label_key) for key, label_key in THEME_COLOR_BASES}
+
+
+@lru_cache(maxsize=None)
+def _accent_labels(language: str) -> Dict[str, str]:
+    return {key: translate(label_key) for key, label_key in ACCENT_COLOR_FIELDS}
+
+
 class SettingsDialog(QtWidgets.QDialog):
     """Позволяет редактировать основные и логирующие параметры приложения."""
 
@@ -70,7 +100,12 @@ class SettingsDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self._settings = settings
         self._connection_manager = connection_manager
-        self.setWindowTitle(translate("settings.dialog.title"))
+        # Группы реестра живут всё время работы приложения, поэтому достаточно
+        # получить их один раз на диалог.
+        self._groups: Dict[str, SettingsGroup] = {
+            name: settings.get_group(name) for name in DIALOG_GROUPS
+        }
+        self.setWindowTitle(_tr("settings.dialog.title"))
         self.resize(600, 420)
         self._color_buttons: Dict[str, QtWidgets.QPushButton] = {}
         self._font_combo: QtWidgets.QFontComboBox | None = None
@@ -93,10 +128,10 @@ class SettingsDialog(QtWidgets.QDialog):
         self._logging_tab = self._build_logging_tab()
         self._appearance_tab = self._build_appearance_tab()
         self._hotkeys_tab = self._build_hotkeys_tab()
-        self._tabs.addTab(self._general_tab, translate("settings.tabs.general"))
-        self._tabs.addTab(self._logging_tab, translate("settings.tabs.logging"))
-        self._tabs.addTab(self._appearance_tab, translate("settings.tabs.appearance"))
-        self._tabs.addTab(self._hotkeys_tab, translate("settings.tabs.hotkeys"))
+        self._tabs.addTab(self._general_tab, _tr("settings.tabs.general"))
+        self._tabs.addTab(self._logging_tab, _tr("settings.tabs.logging"))
+        self._tabs.addTab(self._appearance_tab, _tr("settings.tabs.appearance"))
+        self._tabs.addTab(self._hotkeys_tab, _tr("settings.tabs.hotkeys"))
 
         buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok
@@ -114,18 +149,16 @@ class SettingsDialog(QtWidgets.QDialog):
 
         self._language_combo = QtWidgets.QComboBox()
         self._language_combo.addItems(["ru", "en"])
-        form.addRow(translate("settings.fields.language"), self._language_combo)
+        form.addRow(_tr("settings.fields.language"), self._language_combo)
 
         self._theme_combo = QtWidgets.QComboBox()
         self._theme_combo.addItems(["light", "dark", "system"])
-        form.addRow(translate("settings.fields.theme"), self._theme_combo)
+        form.addRow(_tr("settings.fields.theme"), self._theme_combo)
 
-        self._save_window_state = QtWidgets.QCheckBox(translate("settings.fields.save_window"))
+        self._save_window_state = QtWidgets.QCheckBox(_tr("settings.fields.save_window"))
         form.addRow(self._save_window_state)
 
-        self._refresh_enabled_check = QtWidgets.QCheckBox(
-            translate("settings.fields.refresh_enabled")
-        )
+        self._refresh_enabled_check = QtWidgets.QCheckBox(_tr("settings.fields.refresh_enabled"))
         self._refresh_enabled_check.stateChanged.connect(
             lambda state: self._refresh_spin.setEnabled(state == QtCore.Qt.CheckState.Checked)
         )
@@ -134,31 +167,25 @@ class SettingsDialog(QtWidgets.QDialog):
         self._refresh_spin = QtWidgets.QSpinBox()
         self._refresh_spin.setRange(1000, 60000)
         self._refresh_spin.setSingleStep(500)
-        form.addRow(translate("settings.fields.refresh_rate"), self._refresh_spin)
+        form.addRow(_tr("settings.fields.refresh_rate"), self._refresh_spin)
 
         self._container_stats_spin = QtWidgets.QSpinBox()
         self._container_stats_spin.setRange(500, 60000)
         self._container_stats_spin.setSingleStep(500)
-        form.addRow(
-            translate("settings.fields.container_metrics_refresh"), self._container_stats_spin
-        )
+        form.addRow(_tr("settings.fields.container_metrics_refresh"), self._container_stats_spin)
 
         self._timeout_spin = QtWidgets.QSpinBox()
         self._timeout_spin.setRange(1, 120)
         self._timeout_spin.setSuffix(" s")
-        form.addRow(translate("settings.fields.connection_timeout"), self._timeout_spin)
-        self._timeout_enabled_check = QtWidgets.QCheckBox(
-            translate("settings.fields.timeout_enabled")
-        )
+        form.addRow(_tr("settings.fields.connection_timeout"), self._timeout_spin)
+        self._timeout_enabled_check = QtWidgets.QCheckBox(_tr("settings.fields.timeout_enabled"))
         self._timeout_enabled_check.toggled.connect(self._timeout_spin.setEnabled)
         form.addRow(self._timeout_enabled_check)
 
-        self._auto_load_projects = QtWidgets.QCheckBox(
-            translate("settings.fields.auto_load_projects")
-        )
+        self._auto_load_projects = QtWidgets.QCheckBox(_tr("settings.fields.auto_load_projects"))
         form.addRow(self._auto_load_projects)
         self._auto_activate_connections = QtWidgets.QCheckBox(
-            translate("settings.fields.auto_activate_connections")
+            _tr("settings.fields.auto_activate_connections")
         )
         form.addRow(self._auto_activate_connections)
 
@@ -167,7 +194,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self._system_metrics_spin.setSingleStep(500)
 
         self._system_metrics_checkbox = QtWidgets.QCheckBox(
-            translate("settings.fields.system_metrics_enabled")
+            _tr("settings.fields.system_metrics_enabled")
         )
         self._system_metrics_checkbox.stateChanged.connect(
             lambda state: self._system_metrics_spin.setEnabled(
@@ -175,24 +202,22 @@ class SettingsDialog(QtWidgets.QDialog):
             )
         )
         form.addRow(self._system_metrics_checkbox)
-        form.addRow(translate("settings.fields.system_metrics_refresh"), self._system_metrics_spin)
+        form.addRow(_tr("settings.fields.system_metrics_refresh"), self._system_metrics_spin)
 
         self._default_connection_combo = QtWidgets.QComboBox()
-        self._default_connection_combo.addItem(translate("settings.fields.no_default"), None)
+        self._default_connection_combo.addItem(_tr("settings.fields.no_default"), None)
         if self._connection_manager:
             for connection in self._connection_manager.list_connections():
                 self._default_connection_combo.addItem(connection.name, connection.identifier)
-        form.addRow(translate("settings.fields.default_connection"), self._default_connection_combo)
+        form.addRow(_tr("settings.fields.default_connection"), self._default_connection_combo)
 
-        self._use_system_console = QtWidgets.QCheckBox(
-            translate("settings.fields.use_system_console")
-        )
+        self._use_system_console = QtWidgets.QCheckBox(_tr("settings.fields.use_system_console"))
         form.addRow(self._use_system_console)
 
         self._container_shell_edit = QtWidgets.QLineEdit()
-        form.addRow(translate("settings.fields.container_shell"), self._container_shell_edit)
+        form.addRow(_tr("settings.fields.container_shell"), self._container_shell_edit)
 
-        self._help_button = QtWidgets.QPushButton(translate("settings.general.help"))
+        self._help_button = QtWidgets.QPushButton(_tr("settings.general.help"))
         self._help_button.clicked.connect(self._open_help_dialog)
         form.addRow(self._help_button)
 
@@ -204,21 +229,21 @@ class SettingsDialog(QtWidgets.QDialog):
         widget = QtWidgets.QWidget()
         form = QtWidgets.QFormLayout(widget)
 
-        self._logging_enabled = QtWidgets.QCheckBox(translate("settings.fields.logging_enabled"))
+        self._logging_enabled = QtWidgets.QCheckBox(_tr("settings.fields.logging_enabled"))
         form.addRow(self._logging_enabled)
 
         self._log_level_combo = QtWidgets.QComboBox()
         self._log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
-        form.addRow(translate("settings.fields.logging_level"), self._log_level_combo)
+        form.addRow(_tr("settings.fields.logging_level"), self._log_level_combo)
 
         self._max_file_size_spin = QtWidgets.QSpinBox()
         self._max_file_size_spin.setRange(1, 1000)
         self._max_file_size_spin.setSuffix(" MB")
-        form.addRow(translate("settings.fields.logging_size"), self._max_file_size_spin)
+        form.addRow(_tr("settings.fields.logging_size"), self._max_file_size_spin)
 
         self._max_files_spin = QtWidgets.QSpinBox()
         self._max_files_spin.setRange(1, 50)
-        form.addRow(translate("settings.fields.logging_files"), self._max_files_spin)
+        form.addRow(_tr("settings.fields.logging_files"), self._max_files_spin)
 
         return widget
 
@@ -257,14 +282,15 @@ class SettingsDialog(QtWidgets.QDialog):
         container = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(container)
         layout.setContentsMargins(8, 8, 8, 8)
-        instructions = QtWidgets.QLabel(translate("settings.hotkeys.instructions"))
+        instructions = QtWidgets.QLabel(_tr("settings.hotkeys.instructions"))
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
 
         grid = QtWidgets.QGridLayout()
         grid.setColumnStretch(1, 1)
-        for row_index, (setting_key, translation_key) in enumerate(HOTKEY_ACTIONS):
-            action_label = QtWidgets.QLabel(translate(translation_key))
+        labels = _hotkey_action_labels(get_language())
+        for row_index, (setting_key, action_text) in enumerate(labels.items()):
+            action_label = QtWidgets.QLabel(action_text)
             action_label.setWordWrap(True)
             grid.addWidget(action_label, row_index, 0)
 
@@ -272,13 +298,14 @@ class SettingsDialog(QtWidgets.QDialog):
             self._hotkey_labels[setting_key] = value_label
             grid.addWidget(value_label, row_index, 1)
 
-            change_button = QtWidgets.QPushButton(translate("settings.hotkeys.change"))
-            change_button.clicked.connect(partial(self._change_hotkey, setting_key))
+            change_button = QtWidgets.QPushButton(_tr("settings.hotkeys.change"))
+            change_button.setProperty("hotkey_key", setting_key)
+            change_button.clicked.connect(self._on_change_hotkey_clicked)
             grid.addWidget(change_button, row_index, 2)
 
         layout.addLayout(grid)
 
-        reset_button = QtWidgets.QPushButton(translate("settings.hotkeys.reset"))
+        reset_button = QtWidgets.QPushButton(_tr("settings.hotkeys.reset"))
         reset_button.clicked.connect(self._reset_hotkeys_to_defaults)
         layout.addWidget(reset_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
         layout.addStretch()
@@ -286,40 +313,40 @@ class SettingsDialog(QtWidgets.QDialog):
         return scroll_area
 
     def _create_theme_colors_group(self, variant: str) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox(translate(VARIANT_LABEL_KEYS[variant]))
+        group = QtWidgets.QGroupBox(_tr(VARIANT_LABEL_KEYS[variant]))
         grid = QtWidgets.QGridLayout(group)
-        for row, (base_key, label_key) in enumerate(THEME_COLOR_BASES):
-            key = f"{base_key}_{variant}"
-            label = translate(label_key)
-            self._add_color_picker_row(grid, row, label, key)
+        labels = _theme_color_labels(get_language())
+        for row, (base_key, label) in enumerate(labels.items()):
+            self._add_color_picker_row(grid, row, label, f"{base_key}_{variant}")
 
         reset_button = QtWidgets.QPushButton(
-            translate(
+            _tr(
                 "settings.appearance.reset_light"
                 if variant == "light"
                 else "settings.appearance.reset_dark"
             )
         )
-        reset_button.clicked.connect(partial(self._reset_theme_colors, variant))
+        reset_button.setProperty("theme_variant", variant)
+        reset_button.clicked.connect(self._on_reset_theme_clicked)
         grid.addWidget(reset_button, len(THEME_COLOR_BASES), 0, 1, 2)
         return group
 
     def _create_accent_group(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox(translate("settings.appearance.accents"))
+        group = QtWidgets.QGroupBox(_tr("settings.appearance.accents"))
         grid = QtWidgets.QGridLayout(group)
-        for row, (key, label_key) in enumerate(ACCENT_COLOR_FIELDS):
-            self._add_color_picker_row(grid, row, translate(label_key), key)
+        for row, (key, label) in enumerate(_accent_labels(get_language()).items()):
+            self._add_color_picker_row(grid, row, label, key)
         return group
 
     def _create_font_group(self) -> QtWidgets.QGroupBox:
-        group = QtWidgets.QGroupBox(translate("settings.appearance.font_section"))
+        group = QtWidgets.QGroupBox(_tr("settings.appearance.font_section"))
         layout = QtWidgets.QFormLayout(group)
         self._font_combo = QtWidgets.QFontComboBox()
-        layout.addRow(translate("settings.appearance.font_family"), self._font_combo)
+        layout.addRow(_tr("settings.appearance.font_family"), self._font_combo)
         self._font_size_spin = QtWidgets.QSpinBox()
         self._font_size_spin.setRange(6, 48)
-        layout.addRow(translate("settings.appearance.font_size"), self._font_size_spin)
-        reset_button = QtWidgets.QPushButton(translate("settings.appearance.reset_font"))
+        layout.addRow(_tr("settings.appearance.font_size"), self._font_size_spin)
+        reset_button = QtWidgets.QPushButton(_tr("settings.appearance.reset_font"))
         reset_button.clicked.connect(self._reset_font_settings)
         layout.addRow(reset_button)
         return group
@@ -334,7 +361,9 @@ class SettingsDialog(QtWidgets.QDialog):
         layout.addWidget(QtWidgets.QLabel(label), row, 0)
         button = QtWidgets.QPushButton()
         button.setMinimumWidth(140)
-        button.clicked.connect(partial(self._choose_color, key, label))
+        button.setProperty("color_key", key)
+        button.setProperty("color_label", label)
+        button.clicked.connect(self._on_color_clicked)
         layout.addWidget(button, row, 1)
         self._color_buttons[key] = button
 
@@ -356,7 +385,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self._refresh_spin.setValue(
             self._settings.get_value("connections", "refresh_rate_ms", default=5000)
         )
-        metrics_group = self._settings.get_group("metrics")
+        metrics_group = self._groups["metrics"]
         self._container_stats_spin.setValue(metrics_group.get("container_stats_refresh_ms"))
         timeout_enabled = bool(
             self._settings.get_value("connections", "connection_timeout_enabled", default=True)
@@ -384,11 +413,11 @@ class SettingsDialog(QtWidgets.QDialog):
             if index >= 0:
                 self._default_connection_combo.setCurrentIndex(index)
 
-        terminal_group = self._settings.get_group("terminal")
+        terminal_group = self._groups["terminal"]
         self._use_system_console.setChecked(terminal_group.get("use_system_console"))
         self._container_shell_edit.setText(terminal_group.get("container_shell"))
 
-        logging_group = self._settings.get_group("logging")
+        logging_group = self._groups["logging"]
         self._logging_enabled.setChecked(bool(logging_group.get("enabled")))
         self._log_level_combo.setCurrentText(logging_group.get("level"))
         self._max_file_size_spin.setValue(int(logging_group.get("max_file_size_mb")))
@@ -408,7 +437,7 @@ class SettingsDialog(QtWidgets.QDialog):
         except SettingsValidationError as exc:
             QtWidgets.QMessageBox.warning(
                 self,
-                translate("messages.validation_error_title"),
+                _tr("messages.validation_error_title"),
                 str(exc),
             )
             return
@@ -482,7 +511,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self._settings.set_value("logging", "max_archived_files", int(self._max_files_spin.value()))
 
     def _load_appearance_values(self) -> None:
-        theme_group = self._settings.get_group("theme")
+        theme_group = self._groups["theme"]
         for key, button in self._color_buttons.items():
             self._set_color_button_value(key, theme_group.get(key))
         if self._font_combo:
@@ -507,23 +536,31 @@ class SettingsDialog(QtWidgets.QDialog):
             f"background-color: {normalized}; border: 1px solid #7f7f7f; color: {text_color};"
         )
 
+    def _on_color_clicked(self) -> None:
+        # Ключ и подпись хранятся в свойствах кнопки, поэтому один слот обслуживает все строки
+        button = self.sender()
+        self._choose_color(button.property("color_key"), button.property("color_label"))
+
     def _choose_color(self, key: str, label: str) -> None:
         button = self._color_buttons[key]
         current_value = button.property("color_value") or "#000000"
-        title = translate("settings.appearance.color_picker_title").format(name=label)
+        title = _tr("settings.appearance.color_picker_title").format(name=label)
         color = QtWidgets.QColorDialog.getColor(QtGui.QColor(current_value), self, title)
         if color.isValid():
             self._set_color_button_value(key, color.name())
 
+    def _on_reset_theme_clicked(self) -> None:
+        self._reset_theme_colors(self.sender().property("theme_variant"))
+
     def _reset_theme_colors(self, variant: str) -> None:
-        theme_group = self._settings.get_group("theme")
+        theme_group = self._groups["theme"]
         for base_key, _label in THEME_COLOR_BASES:
             key = f"{base_key}_{variant}"
             default_value = theme_group.get_default(key)
             self._set_color_button_value(key, default_value)
 
     def _reset_font_settings(self) -> None:
-        theme_group = self._settings.get_group("theme")
+        theme_group = self._groups["theme"]
         if self._font_combo:
             default_family = theme_group.get_default("font_family") or self.font().family()
             self._font_combo.setCurrentFont(QtGui.QFont(default_family or self.font().family()))
@@ -548,18 +585,21 @@ class SettingsDialog(QtWidgets.QDialog):
     def _load_hotkeys_values(self) -> None:
         """Загружает текущие значения горячих клавиш."""
 
-        hotkeys_group = self._settings.get_group("hotkeys")
+        hotkeys_group = self._groups["hotkeys"]
         self._hotkeys_state = hotkeys_group.to_dict()
         self._update_hotkeys_display()
 
     def _update_hotkeys_display(self) -> None:
         """Отображает актуальные комбинации в таблице."""
 
-        hotkeys_group = self._settings.get_group("hotkeys")
+        hotkeys_group = self._groups["hotkeys"]
         for key, label in self._hotkey_labels.items():
             value = self._hotkeys_state.get(key) or hotkeys_group.get(key)
             label.setText(value or "-")
 
+    def _on_change_hotkey_clicked(self) -> None:
+        self._change_hotkey(self.sender().property("hotkey_key"))
+
     def _change_hotkey(self, key: str) -> None:
         """Открывает диалог выбора комбинации и обновляет состояние."""
 
@@ -579,12 +619,11 @@ class SettingsDialog(QtWidgets.QDialog):
             None,
         )
         if duplicate_key:
-            labels_map = dict(HOTKEY_ACTIONS)
             QtWidgets.QMessageBox.warning(
                 self,
-                translate("messages.validation_error_title"),
-                translate("settings.hotkeys.dialog.duplicate").format(
-                    action=translate(labels_map.get(duplicate_key, duplicate_key))
+                _tr("messages.validation_error_title"),
+                _tr("settings.hotkeys.dialog.duplicate").format(
+                    action=_hotkey_action_labels(get_language()).get(duplicate_key, duplicate_key)
                 ),
             )
             return
@@ -594,7 +633,7 @@ class SettingsDialog(QtWidgets.QDialog):
     def _reset_hotkeys_to_defaults(self) -> None:
         """Возвращает горячие клавиши к значениям по умолчанию."""
 
-        hotkeys_group = self._settings.get_group("hotkeys")
+        hotkeys_group = self._groups["hotkeys"]
         for key, _ in HOTKEY_ACTIONS:
             try:
                 self._hotkeys_state[key] = hotkeys_group.get_default(key)
@@ -631,16 +670,16 @@ class HotkeyCaptureDialog(QtWidgets.QDialog):
         if current_value and current_value != "-":
             self._sequence_edit.setKeySequence(QtGui.QKeySequence(current_value))
         self._current_label = QtWidgets.QLabel(
-            translate("settings.hotkeys.dialog.current").format(value=current_value or "-")
+            _tr("settings.hotkeys.dialog.current").format(value=current_value or "-")
         )
 
-        self.setWindowTitle(translate("settings.hotkeys.dialog.title"))
+        self.setWindowTitle(_tr("settings.hotkeys.dialog.title"))
         self.resize(420, 180)
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
-        instructions = QtWidgets.QLabel(translate("settings.hotkeys.dialog.hint"))
+        instructions = QtWidgets.QLabel(_tr("settings.hotkeys.dialog.hint"))
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
 
@@ -649,14 +688,14 @@ class HotkeyCaptureDialog(QtWidgets.QDialog):
         layout.addWidget(self._current_label)
 
         buttons = QtWidgets.QHBoxLayout()
-        clear_button = QtWidgets.QPushButton(translate("settings.hotkeys.dialog.clear"))
+        clear_button = QtWidgets.QPushButton(_tr("settings.hotkeys.dialog.clear"))
         clear_button.clicked.connect(self._on_clear_clicked)
         buttons.addWidget(clear_button)
         buttons.addStretch()
 
-        done_button = QtWidgets.QPushButton(translate("settings.hotkeys.dialog.done"))
+        done_button = QtWidgets.QPushButton(_tr("settings.hotkeys.dialog.done"))
         done_button.clicked.connect(self._on_done_clicked)
-        cancel_button = QtWidgets.QPushButton(translate("actions.close"))
+        cancel_button = QtWidgets.QPushButton(_tr("actions.close"))
         cancel_button.clicked.connect(self.reject)
         buttons.addWidget(done_button)
         buttons.addWidget(cancel_button)
@@ -665,7 +704,7 @@ class HotkeyCaptureDialog(QtWidgets.QDialog):
     def _on_sequence_changed(self, sequence: QtGui.QKeySequence) -> None:
         self.sequence = sequence.toString(QtGui.QKeySequence.SequenceFormat.NativeText)
         self._current_label.setText(
-            translate("settings.hotkeys.dialog.current").format(value=self.sequence or "-")
+            _tr("settings.hotkeys.dialog.current").format(value=self.sequence or "-")
         )
 
     def _on_clear_clicked(self) -> None:
@@ -0,0 +1,42 @@
+"""Тесты блокирующего запуска команд проекта."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+
+import pytest
+
+from src.projects import executor
+from src.projects.executor import ProjectRunCancelled, _run_blocking
+
+
+def test_run_blocking_with_cancel_event_returns_output() -> None:
+    output, code = _run_blocking("echo hello; exit 3", None, 0, {}, threading.Event())
+    assert output == "hello\n"
+    assert code == 3
+
+
+def test_run_blocking_terminates_cancelled_command() -> None:
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    started = time.monotonic()
+    with pytest.raises(ProjectRunCancelled):
+        _run_blocking("sleep 5", None, 0, {}, cancel)
+    assert time.monotonic() - started < 3
+
+
+def test_run_blocking_kills_command_ignoring_sigterm(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(executor, "_CANCEL_GRACE_PERIOD", 0.2)
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+    started = time.monotonic()
+    with pytest.raises(ProjectRunCancelled):
+        _run_blocking("trap '' TERM; sleep 5", None, 0, {}, cancel)
+    assert time.monotonic() - started < 3
+
+
+def test_run_blocking_with_cancel_event_keeps_timeout() -> None:
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_blocking("sleep 5", None, 1, {}, threading.Event())
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 import pytest
 
 from src.connections.models import Connection
+from src.projects.executor import ProjectRunCancelled
 from src.projects.manager import ProjectManager
 from src.projects.models import Project
 
@@ -49,7 +50,7 @@ def test_run_project_records_history(tmp_path: Path, monkeypatch: pytest.MonkeyP
 
     monkeypatch.setattr(
         "src.projects.manager.execute_project",
-        lambda project, connection, log_file: SimpleNamespace(
+        lambda project, connection, log_file, cancel=None: SimpleNamespace(
             status="success",
             log_file=log_file,
             error_message=None,
@@ -60,3 +61,26 @@ def test_run_project_records_history(tmp_path: Path, monkeypatch: pytest.MonkeyP
     assert entry.status == "success"
     project = manager.get_project("proj")
     assert len(project.run_history) == 1
+
+
+def test_run_project_logs_cancellation_as_info(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    manager = ProjectManager(tmp_path, tmp_path / "logs")
+    manager.add_project(make_project())
+    messages: list[str] = []
+    monkeypatch.setattr(
+        manager, "_append_project_log", lambda project, message: messages.append(message)
+    )
+
+    def cancelled(project, connection, log_file, cancel=None):
+        raise ProjectRunCancelled(project.command_or_path)
+
+    monkeypatch.setattr("src.projects.manager.execute_project", cancelled)
+    connection = Connection(identifier="local", name="Local", socket="unix:///var/run/docker.sock")
+    caplog.set_level("INFO")
+    with pytest.raises(ProjectRunCancelled):
+        manager.run_project("proj", connection)
+    assert messages == ["проект запущен", "запуск отменён"]
+    assert not [record for record in caplog.records if record.levelname == "ERROR"]
+    assert manager.get_project("proj").run_history == []
@@ -0,0 +1,73 @@
+"""Тесты вспомогательных функций диалога деталей контейнера."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from PySide6 import QtWidgets
+
+from src.ui.dialogs.container_details import (
+    LOG_PREFIX_RE,
+    ContainerDetailsDialog,
+    _line_starts,
+    _matching_lines,
+    _normalize_logs,
+    _strip_log_prefix,
+)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "2024-01-01 10:00:00 | started",
+        "  2024-01-01  10:00:00.123 - started",
+        "2024-01-01 10:00:00,5|started",
+        "2024-01-01 10:00:00. | started",
+        "2024-01-01T10:00:00 | started",
+        "2024-01-01 10:00:0 | started",
+        "2024-01-01 10:00:00 -started",
+        "[INFO] | started",
+        "[INFO]  :  started",
+        "[INFO]-started",
+        "[] | started",
+        "[INFO]",
+        "plain line",
+        "",
+        "   ",
+    ],
+)
+def test_strip_log_prefix_matches_regex(line: str) -> None:
+    assert _strip_log_prefix(line) == LOG_PREFIX_RE.sub("", line)
+
+
+def test_matching_lines_returns_each_matching_line_once() -> None:
+    text = _normalize_logs("error one\r\nok\nerror error\n\nlast error\n")
+    starts = _line_starts(text)
+    assert list(_matching_lines(text, starts, "error")) == [0, 2, 4]
+    assert list(_matching_lines(text, starts, "missing")) == []
+
+
+@pytest.fixture(scope="module")
+def qapp() -> QtWidgets.QApplication:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_inspect_tree_keeps_key_order_on_expand(qapp: QtWidgets.QApplication) -> None:
+    state = {"Status": "running", "Running": True, "Pid": 42, "Paused": False}
+    inspect_data = {"State": state, "Mounts": [{"Size": 2**70}]}
+    dialog = ContainerDetailsDialog(container_name="web", logs="", inspect_data=inspect_data)
+    try:
+        tree = dialog._inspect_tree
+        state_item = tree.topLevelItem(0)
+        state_item.setExpanded(True)
+        children = [state_item.child(i) for i in range(state_item.childCount())]
+        assert [child.text(0) for child in children] == list(state)
+
+        tree.topLevelItem(1).setExpanded(True)
+        mount_item = tree.topLevelItem(1).child(0)
+        mount_item.setExpanded(True)
+        assert mount_item.child(0).text(1) == str(2**70)
+    finally:
+        dialog.deleteLater()
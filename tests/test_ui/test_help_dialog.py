@@ -0,0 +1,52 @@
+"""Тесты поиска в диалоге справки."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from PySide6 import QtWidgets
+
+from src.ui.dialogs.help import HelpDialog, _find_utf16
+
+
+@pytest.fixture(scope="module")
+def qapp() -> QtWidgets.QApplication:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _utf16(text: str) -> bytes:
+    return text.encode("utf-16-le")
+
+
+def test_find_utf16_counts_code_units_after_emoji() -> None:
+    text = _utf16("🐳 docker, docker")
+    # Эмодзи занимает две кодовые единицы UTF-16, как в QTextDocument
+    assert _find_utf16(text, _utf16("docker"), 0) == 3
+    assert _find_utf16(text, _utf16("docker"), 4) == 11
+    assert _find_utf16(text, _utf16("missing"), 0) == -1
+
+
+def test_find_utf16_skips_matches_across_character_boundaries() -> None:
+    # b"\x00a" встречается с нечётного смещения внутри "aa", но не как символ
+    assert _find_utf16(_utf16("aa"), b"\x00a", 0) == -1
+    assert _find_utf16(_utf16("a愀"), _utf16("愀"), 0) == 1
+
+
+@pytest.mark.parametrize("title", ["Help 🐳", "Help İstanbul"])
+def test_search_highlights_match_in_document(
+    qapp: QtWidgets.QApplication, tmp_path: Path, title: str
+) -> None:
+    (tmp_path / "faq_en.md").write_text(f"# {title}\n\nUse docker and DOCKER.\n", "utf-8")
+    dialog = HelpDialog(language="en", resources_dir=tmp_path)
+    try:
+        dialog._search_edit.setText("Docker")
+        selections = []
+        for _ in range(3):
+            dialog._on_search_clicked()
+            selections.append(dialog._text_browser.textCursor().selectedText())
+        assert selections == ["docker", "DOCKER", "docker"]
+    finally:
+        dialog.deleteLater()
@@ -0,0 +1,184 @@
+"""Тесты разбора лог-файлов приложения."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.ui.dialogs import logs
+from src.ui.dialogs.logs import (
+    LOG_PATTERNS,
+    LogParseSignals,
+    LogParseTask,
+    _build_search_index,
+    _LogParser,
+    _matching_entries,
+    _parse_timestamp,
+    _parse_log_text,
+    _read_log_entries,
+    _read_log_text,
+)
+
+
+def _parse_line_by_line(text: str) -> list[tuple[str, str, str]]:
+    result = []
+    for line in text.splitlines():
+        match = next((m for m in (p.match(line) for p in LOG_PATTERNS) if m), None)
+        if match is None:
+            result.append((line, "INFO", line))
+        else:
+            result.append((line, match.group("level"), match.group("message").strip()))
+    return result
+
+
+def test_parse_log_text_matches_per_line_patterns() -> None:
+    text = (
+        "[2024-01-01 10:00:00] INFO - started\n"
+        "2024-01-01 10:00:01,250 | ERROR | failed  \n"
+        "Traceback (most recent call last):\n"
+        "\n"
+        "[broken\n"
+        "] WARNING - not a record\n"
+        "2024-01-01\n"
+        "10:00:02 | INFO | split\n"
+        "[2024-01-01T10:00:03] DEBUG : last"
+    )
+    entries = _parse_log_text(text)
+    assert [(e.raw, e.level, e.message) for e in entries] == _parse_line_by_line(text)
+    assert [e.line_no for e in entries] == list(range(len(entries)))
+    assert entries[1].timestamp == datetime(2024, 1, 1, 10, 0, 1, 250000)
+    assert entries[2].timestamp is None
+
+
+def test_parse_log_text_line_endings() -> None:
+    assert _parse_log_text("") == []
+    assert [e.raw for e in _parse_log_text("\n")] == [""]
+    assert [e.raw for e in _parse_log_text("a\nb\n")] == ["a", "b"]
+
+
+def test_read_log_entries_in_small_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log_file = tmp_path / "app.log"
+    log_file.write_bytes(
+        "[2024-01-01 10:00:00] INFO - привет\r\n".encode("utf-8") * 3
+        + b"x" * 40
+        + b"\n2024-01-01 10:00:01 | ERROR | tail"
+    )
+    monkeypatch.setattr(logs, "LOG_READ_BLOCK_SIZE", 7)
+    expected = _parse_log_text(_read_log_text(log_file))
+    for mmap_threshold in (1 << 30, 0):
+        monkeypatch.setattr(logs, "LOG_MMAP_THRESHOLD", mmap_threshold)
+        entries = _read_log_entries(log_file)
+        assert [(e.line_no, e.raw, e.message) for e in entries] == [
+            (e.line_no, e.raw, e.message) for e in expected
+        ]
+        assert len(entries) == 5
+
+
+def test_read_log_entries_parallel_matches_sequential(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_file = tmp_path / "big.log"
+    log_file.write_text(
+        "".join(f"2024-01-01 10:00:{i % 60:02d} | INFO | message {i}\n" for i in range(500)),
+        encoding="utf-8",
+    )
+    expected = _read_log_entries(log_file)
+    monkeypatch.setattr(logs, "LOG_PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(logs.os, "cpu_count", lambda: 3)
+    entries = _read_log_entries(log_file)
+    assert [(e.line_no, e.raw) for e in entries] == [(e.line_no, e.raw) for e in expected]
+
+
+def test_read_log_entries_falls_back_when_parallel_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_file = tmp_path / "big.log"
+    log_file.write_text("2024-01-01 10:00:00 | INFO | message\n", encoding="utf-8")
+
+    def broken(path: Path, size: int, workers: int) -> list:
+        raise RuntimeError("worker crashed")
+
+    monkeypatch.setattr(logs, "_read_log_entries_parallel", broken)
+    monkeypatch.setattr(logs, "LOG_PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(logs.os, "cpu_count", lambda: 3)
+    assert [entry.message for entry in _read_log_entries(log_file)] == ["message"]
+
+
+def test_log_parse_task_reports_unexpected_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken(path: Path) -> list:
+        raise UnicodeDecodeError("utf-8", b"", 0, 1, "broken")
+
+    monkeypatch.setattr(logs, "_read_log_entries", broken)
+    signals = LogParseSignals()
+    received: list = []
+    signals.finished.connect(lambda request_id, entries: received.append((request_id, entries)))
+    LogParseTask(7, tmp_path / "app.log", signals).run()
+    assert received == [(7, [])]
+
+
+def test_matching_entries_returns_each_entry_once() -> None:
+    entries = _parse_log_text("Error one\nok\nerror ERROR\n\nlast error")
+    haystack, starts = _build_search_index(entries)
+    assert _matching_entries(haystack, starts, "error") == [0, 2, 4]
+    assert _matching_entries(haystack, starts, "missing") == []
+    assert _matching_entries(haystack, starts, "ERROR ONE") == [0]
+    cyrillic = _parse_log_text("Ошибка диска\nвсё хорошо")
+    assert _matching_entries(*_build_search_index(cyrillic), "ОШИБКА") == [0]
+    assert _matching_entries(*_build_search_index([]), "error") == []
+
+
+def test_log_parser_puts_frequent_pattern_first() -> None:
+    parser = _LogParser()
+    parser.parse("2024-01-01 10:00:00 | INFO | a\n2024-01-01 10:00:01 | INFO | b\n")
+    block = "[2024-01-01 10:00:02] ERROR - c\n2024-01-01 10:00:03 | INFO | d\n"
+    entries = parser.parse(block, 2)
+    assert [(e.line_no, e.level, e.message) for e in entries] == [
+        (2, "ERROR", "c"),
+        (3, "INFO", "d"),
+    ]
+    assert parser._order == (1, 0)
+
+
+def _parse_timestamp_strptime_first(value: str) -> datetime | None:
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S,%f"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01 10:00:00",
+        "2024-01-01 10:00:00,5",
+        "2024-01-01 10:00:00,123456",
+        "2024-01-01 10:00:00.123",
+        "2024-01-01  10:00:00",
+        "2024-1-5 7:08:09",
+        "2024-01-01T10:00:00+03:00",
+        "2024-02-30 10:00:00",
+        "yesterday",
+    ],
+)
+def test_parse_timestamp_matches_strptime_order(value: str) -> None:
+    assert _parse_timestamp(value) == _parse_timestamp_strptime_first(value)
+
+
+def test_ts_epoch_uses_wall_clock_seconds() -> None:
+    entries = _parse_log_text(
+        "[2024-01-01T10:00:00+03:00] INFO - aware\n"
+        "2024-01-01 10:00:00,900 | INFO | naive\n"
+        "2024-01-01 10:00:01 | INFO | next\n"
+        "no timestamp"
+    )
+    assert entries[0].ts_epoch == entries[1].ts_epoch == entries[2].ts_epoch - 1
+    assert entries[3].ts_epoch == -1
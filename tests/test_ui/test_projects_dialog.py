@@ -0,0 +1,134 @@
+"""Тесты вспомогательных функций диалога проектов."""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+import threading
+from typing import List, Optional, Tuple
+
+import pytest
+from PySide6 import QtCore
+
+from src.connections.models import Connection
+from src.ui.dialogs import projects
+from src.ui.dialogs.projects import (
+    ProjectActionsDelegate,
+    ProjectRunDispatcher,
+    ProjectRunError,
+    _normalize_identifier,
+    _parse_created,
+)
+
+
+def _normalize_identifier_reference(value: str) -> str:
+    slug = value.strip().lower().replace(" ", "-")
+    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    slug = re.sub(r"-+", "-", slug)
+    return slug.strip("-")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "my-project",
+        "  My Project  ",
+        "a -!- b",
+        "a!b",
+        "--Lead--and--trail--",
+        "tab\tseparated",
+        "Проект 2",
+        "Ünïcode name",
+        "",
+        "   ",
+        "!!!",
+    ],
+)
+def test_normalize_identifier_matches_reference(value: str) -> None:
+    result = _normalize_identifier(value)
+    assert result == _normalize_identifier_reference(value)
+    assert re.fullmatch(r"(?:[a-z0-9]+(?:-[a-z0-9]+)*)?", result)
+
+
+def test_actions_delegate_hit_test_maps_points_to_actions() -> None:
+    delegate = ProjectActionsDelegate()
+    width = ProjectActionsDelegate.CELL_WIDTH
+    rect = QtCore.QRect(100, 20, 200, 30)
+    hits = [
+        delegate._action_at(rect, QtCore.QPoint(x, 30))
+        for x in (100, 100 + width - 1, 100 + width, 100 + 2 * width + 5, 100 + 3 * width, 99)
+    ]
+    assert hits == [0, 0, 1, 2, None, None]
+    assert delegate._action_at(rect, QtCore.QPoint(110, 60)) is None
+
+
+def test_parse_created_matches_storage_format() -> None:
+    value = "2024-03-05T07:08:09Z"
+    expected = dt.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+    assert _parse_created(value) == (expected, "2024-03-05")
+    assert _parse_created(None) == (dt.datetime.min, "—")
+    assert _parse_created("") == (dt.datetime.min, "—")
+    assert _parse_created("not a date") == (dt.datetime.min, "not a date")
+
+
+class _PausedPool:
+    """Пул, который только запоминает задачи: очередь диспетчера разбирается вручную."""
+
+    def __init__(self) -> None:
+        self.started: List[object] = []
+
+    def maxThreadCount(self) -> int:
+        return 1
+
+    def start(self, task: object) -> None:
+        self.started.append(task)
+
+
+class _RecordingManager:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str]] = []
+
+    def run_project(
+        self, identifier: str, connection: Connection, cancel: Optional[threading.Event] = None
+    ) -> str:
+        self.calls.append((identifier, connection.identifier))
+        if identifier == "missing":
+            raise FileNotFoundError("/tmp/missing.yml")
+        return identifier
+
+
+def test_run_dispatcher_coalesces_queued_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = _PausedPool()
+    monkeypatch.setattr(projects, "_project_run_pool", lambda: pool)
+    manager = _RecordingManager()
+    dispatcher = ProjectRunDispatcher(manager)  # type: ignore[arg-type]
+    first = Connection(identifier="first", name="First", socket="")
+    second = Connection(identifier="second", name="Second", socket="")
+
+    run_id = dispatcher.submit("proj", first)
+    assert dispatcher.submit("proj", second) == run_id
+    other_id = dispatcher.submit("other", first)
+    assert other_id != run_id
+    assert len(pool.started) == 1
+
+    dispatcher.drain_submissions()
+    assert manager.calls == [("proj", "second"), ("other", "first")]
+    assert dispatcher.submit("proj", first) not in (run_id, other_id)
+
+
+def test_run_dispatcher_formats_errors_only_for_listeners(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(projects, "_project_run_pool", _PausedPool)
+    dispatcher = ProjectRunDispatcher(_RecordingManager())  # type: ignore[arg-type]
+    connection = Connection(identifier="local", name="Local", socket="")
+
+    dispatcher.submit("missing", connection)
+    dispatcher.drain_submissions()
+    dispatcher.error.connect(lambda _run_id, _error: None)
+    dispatcher.submit("missing", connection)
+    dispatcher.drain_submissions()
+
+    errors = [payload for _run_id, _succeeded, payload in dispatcher._completions]
+    assert errors == [
+        ProjectRunError("file", ""),
+        ProjectRunError("file", "/tmp/missing.yml"),
+    ]
@@ -0,0 +1,22 @@
+"""Тесты вспомогательных функций диалога настроек."""
+
+from __future__ import annotations
+
+from src.i18n.translator import get_language, set_language, translate
+from src.ui.dialogs.settings import HOTKEY_ACTIONS, _hotkey_action_labels, _tr
+
+
+def test_cached_translation_follows_language() -> None:
+    previous = get_language()
+    try:
+        for language in ("ru", "en", "ru"):
+            set_language(language)
+            assert _tr("settings.dialog.title") == translate("settings.dialog.title")
+    finally:
+        set_language(previous)
+
+
+def test_hotkey_action_labels_keep_action_order() -> None:
+    labels = _hotkey_action_labels(get_language())
+    assert list(labels) == [key for key, _ in HOTKEY_ACTIONS]
+    assert labels["open_settings"] == translate("settings.hotkeys.actions.open_settings")